@@ -20,69 +20,15 @@ import random
 import sys
 sys.path.insert(0,'..')
 import constants
+import sonar_engine
+import geometry
+import obstacle_index
+import trajectory
+from geometry import brg_in_deg, dist, relative_brg, angle_to_vector, create_vector, dist_and_brg_in_deg, rel_brg_fm_offset_sensor
 
-def rel_brg_fm_offset_sensor(true_hdg, sensor_offset, tgt_brg):
-    #given robot's true heading, the sensor offset angle and the
-    #true brg of the target, this fn will return the relative brg
-    #of the target from the sensor's line of sight
-    
-    sensor_look_brg = (true_hdg + sensor_offset)%360
-    tgt_rel_fm_sensor = tgt_brg - sensor_look_brg
-
-    if tgt_rel_fm_sensor < -180:
-        tgt_rel_fm_sensor += 360
-    
-    return tgt_rel_fm_sensor
-
-def brg_in_deg(p0, p1):#bearing only in degrees
-    [x1, y1] = p0
-    [x2, y2] = p1
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return b
-
-def dist(p1, p0):#distance only
-    print(f"dist - p1={p1}, p0={p0}")
-    return math.sqrt((p1[0] - p0[0])**2+(p1[1]-p0[1])**2)
-
-def dist_and_brg_in_deg(p0, p1):#bearing and distance in degrees between two points
-    [x1, y1] = p0
-    [x2, y2] = p1
-    r = math.sqrt((x1 - x2)**2 + (y1 - y2)**2) # distance
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return r, b
-
-def angle_to_vector(ang):#resolve angles into vectors
-    ang = math.radians(ang)
-    return [math.cos(ang), math.sin(ang)]
-
-def relative_brg(b1, b2):
-    rb = b2 - b1
-    if rb > 180:
-        rb = 360 - rb
-    if rb < -180:
-        rb += 360
-        rb *= -1
-    return rb
+SONAR = "sonar" # the robot avoids the obstacles in view with the sonar outputs
+EDT = "edt" # the robot avoids the obstacles with the clearance map of the episode (see clearance_map.py)
 
-def create_vector(from_pos, length, brg):       
-        u_vec = angle_to_vector(brg)
-        #print "generating target line..."
-        vec0 = from_pos[0] + length * u_vec[1] 
-        vec1 = from_pos[1] - length * u_vec[0]
-        
-        return [vec0, vec1]
-
-    
 #define classes
 
 class Sonar:
@@ -93,7 +39,7 @@ class Sonar:
         self.max_r = max_r
         self.offset =  index * FOV #+ FOV/2 # on what relative bearing is this sensor looking?
         self.look_brg = (robot_co + self.offset)%360
-        self.vec = [0,0] # just a vector for grpahical ouptut of pings
+        self.output = constants.SENSOR_MAX_R
         self.has_valid_echo = False #indicates if this sonar has a "valid" obstacle in sight
         #print "Creating Sonar:" , index, " offset ", self.offset, "true LOS:", self.look_brg
             
@@ -158,9 +104,21 @@ class Sonar:
         
         self.ping_simulated(obstacle_list, platform_co)
         
-        self.vec = create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)#calculate distance vector for drawing on canvas
-        
         #print "sensor index:", self.index, " look brg:", self.look_brg
+    def set_output(self, platform_pos, platform_co, output, has_valid_echo):
+        #store the output calculated for this sensor by the batched sonar engine
+        self.set_pose(platform_pos, platform_co)
+        self.output = output
+        self.has_valid_echo = has_valid_echo
+
+    def set_pose(self, platform_pos, platform_co):
+        self.pos = platform_pos
+        self.look_brg = (platform_co + self.offset)%360
+
+    @property
+    def vec(self): # just a vector for grpahical ouptut of pings, only calculated when the sonar is drawn
+        return create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)
+
     def draw(self, canvas): # draw the sensor's output
         #if self.has_valid_echo:
         canvas.draw_line(self.pos,self.vec, 1, 'lime')
@@ -169,7 +127,7 @@ class Sonar:
         
 # It has some utility functions for the group of sensors
 class Sonar_Array:
-    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co):
+    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co, model=None):
         self.sonar_list = []
         self.need_diversion_flag = False
         self.n_sensor = n_sensor
@@ -182,12 +140,24 @@ class Sonar_Array:
         
         for i in i_pos:#create a list of individual sonars...
             self.sonar_list.append(Sonar(i, SENSOR_FOV, SENSOR_MAX_R, robot_co))
+        self.max_r = SENSOR_MAX_R
+        self.offsets = [s.offset for s in self.sonar_list]
+        self.model = model or constants.SONAR_MODEL # see sonar_engine.py
+        self.view_r = sonar_engine.view_radius(self.model) # obstacles closer than this can be seen
+        self.ping_cache = sonar_engine.PingCache()
+        self.pos = [0,0]
+        self.co = robot_co
    
     # called by the robot to get the direction of the next movement
     def update(self, robot_pos, robot_co, obstacle_list, method):
-        #update sonar array
-        for sonar in self.sonar_list:#update output of each sensor
-            sonar.update(robot_pos, robot_co, obstacle_list)
+        self.pos = robot_pos
+        self.co = robot_co
+        #update sonar array, all the sensors against all the obstacles in one batched pass
+        #skipped if the outputs are still the same (e.g. no obstacles in view)
+        if self.ping_cache.is_stale(robot_pos, robot_co, obstacle_list):
+            outputs, echoes = sonar_engine.ping(robot_pos, robot_co, self.offsets, obstacle_list, self.max_r, self.model)
+            for sonar, output, echo in zip(self.sonar_list, outputs, echoes):#update output of each sensor
+                sonar.set_output(robot_pos, robot_co, float(output), bool(echo))
             
         if method == "w_sum":#process data by method of weighted sums
             return self.weighted_sum_method(robot_pos, robot_co)
@@ -236,21 +206,29 @@ class Sonar_Array:
     # draw the sonar
     def draw(self, canvas):
         for sonar in self.sonar_list:
+            sonar.set_pose(self.pos, self.co)#the sensors are not updated when the ping is skipped
             sonar.draw(canvas)
 
 # Robot is the agent.
 # It knows its position and the goal position
 class Robot:
-    def __init__(self, pos, co, n_sensor, goal_pos):
+    def __init__(self, pos, co, n_sensor, goal_pos, sonar_model=None, clearance_model=None):
         self.steps = 0
         self.pos = pos
-        self.history = [pos]
+        self.history = trajectory.Trajectory(constants.TRAJECTORY_MAX_LEN)
+        self.history.append(pos)
         self.co = co
         self.spd = 10 # robot speed in pixels/ step
-        self.s_array = Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co)
+        self.s_array = Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co, sonar_model)
         self.goal_brg = brg_in_deg(self.pos, goal_pos)
         self.obstacles_in_view = []
         self.goal_pos = goal_pos
+        self.clearance_model = clearance_model or constants.CLEARANCE_MODEL
+        self.clearance = None # clearance map of the obstacles, with the edt model
+        if self.clearance_model == EDT:
+            #clearance_map needs scipy, it is only imported with this model
+            import clearance_map
+            self.clearance_map = clearance_map
         
     
     def get_obstacles_in_view(self):
@@ -259,21 +237,27 @@ class Robot:
     # this is the most important methond, which moves the agent in the environment
     def update(self, full_obstacle_list, goal_pos):
         self.steps += 1
-        self.obstacles_in_view = [] #delete all the old obstacles in view
-        for obs in full_obstacle_list:
-            if dist(self.pos, obs) < constants.SENSOR_MAX_R:
-                self.obstacles_in_view.append(obs)
+        #replace the old obstacles in view
+        self.obstacles_in_view = obstacle_index.index_for(full_obstacle_list).within(self.pos, self.s_array.view_r)
                 
         #re-calculate direction to goal
         self.goal_brg = brg_in_deg(self.pos, goal_pos)
-        #re-estimate sensor output by weighted sum method
-        co1, need_turn = self.s_array.update(self.pos, self.goal_brg, self.obstacles_in_view, "w_sum")
-        if self.path_is_clear(goal_pos):#can we reach the goal directly from here?
-            self.co = brg_in_deg(self.pos, goal_pos)
-        elif need_turn: #do we need to turn
-            self.co = co1
-        else: # path is not fully clear, but there are no immediate obstacles
-            pass
+        if self.clearance_model == EDT:
+            #the clearance map replaces the sonar outputs, the turn is only looked for when the way ahead is not clear
+            self.clearance = self.clearance_map.map_for(full_obstacle_list)
+            if self.way_to_goal_is_clear(goal_pos):
+                self.co = brg_in_deg(self.pos, goal_pos)
+            else:
+                self.co = self.clearance_turn()
+        else:
+            #re-estimate sensor output by weighted sum method
+            co1, need_turn = self.s_array.update(self.pos, self.goal_brg, self.obstacles_in_view, "w_sum")
+            if self.path_is_clear(goal_pos):#can we reach the goal directly from here?
+                self.co = brg_in_deg(self.pos, goal_pos)
+            elif need_turn: #do we need to turn
+                self.co = co1
+            else: # path is not fully clear, but there are no immediate obstacles
+                pass
 
         #move the robot by one step...
         self.move(1)
@@ -281,20 +265,31 @@ class Robot:
 
     #return True if there is a clear path to the goal
     def path_is_clear(self, goal_pos):#return True if there is a clear path to the goal
-        goal_brg = brg_in_deg(self.pos, goal_pos)
-        for obs in self.obstacles_in_view:
-            if dist(self.pos, goal_pos) > dist(self.pos, obs):
-                d_obs, obs_brg = dist_and_brg_in_deg(self.pos, obs)
-                rel_brg = abs(relative_brg(goal_brg, obs_brg))
-                rel_brg_radians = math.radians(rel_brg)
-                print(f"rel_brg_radians={rel_brg_radians}")
-                if rel_brg_radians < -1 or rel_brg_radians > 1:
-                    print(f"invalid rel_brg_radians={rel_brg_radians}")
-                    return False
-                d_lateral = abs(d_obs * math.asin(rel_brg_radians))
-                if d_lateral < constants.OBSTACLE_RAD + constants.ROBOT_RAD: 
-                    return False
-        return True
+        return geometry.path_is_clear(self.pos, goal_pos, self.obstacles_in_view)
+
+    #with the edt model: True if the next CLEARANCE_LOOKAHEAD pixels towards the goal (or up to the goal when
+    #it is closer) are clear, see heading_is_clear. It is a lookahead check, not a check of the whole path
+    def way_to_goal_is_clear(self, goal_pos):
+        return self.heading_is_clear(self.goal_brg, dist(self.pos, goal_pos))
+
+    #with the edt model: True if the robot can walk up to CLEARANCE_LOOKAHEAD pixels (or length) on the heading
+    #without getting closer to the obstacles than CLEARANCE_SAFETY, or than it already is
+    def heading_is_clear(self, heading, length=None):
+        end_pos = create_vector(self.pos, min(length if length is not None else constants.CLEARANCE_LOOKAHEAD, constants.CLEARANCE_LOOKAHEAD), heading)
+        required = min(constants.CLEARANCE_SAFETY, self.clearance.clearance_at(self.pos) - self.clearance.cell_size)
+        return self.clearance.path_is_clear(self.pos, end_pos, required)
+
+    #with the edt model: the heading closest to the goal that is clear, turning first to the side the clearance
+    #gradient points to (away from the nearest obstacles). Out of options, the robot follows the gradient
+    def clearance_turn(self):
+        gradient = self.clearance.gradient_at(self.pos)
+        gradient_brg = brg_in_deg((0, 0), gradient)
+        side = 1 if (gradient_brg - self.goal_brg + 180) % 360 - 180 > 0 else -1
+        for k in range(1, int(180 / constants.SENSOR_FOV) + 1):
+            for heading in ((self.goal_brg + side * k * constants.SENSOR_FOV) % 360, (self.goal_brg - side * k * constants.SENSOR_FOV) % 360):
+                if self.heading_is_clear(heading):
+                    return heading
+        return gradient_brg
 
     # detect if the robot has reached the goal
     def has_reached_goal(self, goal_pos):
@@ -313,17 +308,9 @@ class Robot:
     # detect if the robot has hit an obstacle
     def has_hit_obstacle(self, full_obstacle_list):
         print(f"self.pos={self.pos}, full_obstacle_list={full_obstacle_list}")
-        x = self.pos[0]
-        y = self.pos[1]
-        radius = 12.5
-
-        for obstacle_pos in full_obstacle_list:
-            center_x = obstacle_pos[0]
-            center_y = obstacle_pos[1]
-            print(f"x={x}, y={y}, center_x={center_x}, center_y={center_y}")
-            if (x - center_x)**2 + (y - center_y)**2 < radius**2:
-                print("WE HIT THE OBSTACLE! START CRYING!!!!")
-                return True
+        if len(obstacle_index.index_for(full_obstacle_list).within(self.pos, constants.OBSTACLE_RAD)) > 0:
+            print("WE HIT THE OBSTACLE! START CRYING!!!!")
+            return True
         return False
     
     def move(self, dT):
@@ -333,7 +320,7 @@ class Robot:
         self.pos[0] += self.spd * dT * u_vec[1]
         self.pos[1] -= self.spd * dT * u_vec[0]
         
-        self.history.append([self.pos[0], self.pos[1]])
+        self.history.append(self.pos)
         
     def get_pos(self):
         return self.pos
@@ -346,7 +333,7 @@ class Robot:
         #print "setting robot co:", self.co
     
     def delete_history(self):
-        self.history = []
+        self.history.clear()
 
     # draw the robot in the ui
     def draw(self, canvas):
@@ -359,8 +346,9 @@ class Robot:
         #Draw current heading vector
         self.co_vec = create_vector(self.pos, 150, self.co)
         canvas.draw_line(self.pos, self.co_vec, 2, "white")
-        #draw the output of the sonar array
-        self.s_array.draw(canvas)
+        #draw the output of the sonar array, not used (nor updated) with the edt model
+        if self.clearance_model != EDT:
+            self.s_array.draw(canvas)
         #draw the obstacles in view
         for obs in self.obstacles_in_view:
             canvas.draw_circle(obs,2,1, "red")
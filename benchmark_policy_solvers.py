@@ -0,0 +1,114 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Compare the learners of the dynamic policies (Monte Carlo, Q-learning and SARSA, see policy_solvers.py)
+on the same random layouts of the 4x4 and 5x5 grids, with the parameters of monte_carlo.py and
+monte_carlo_5x5.py. For each learner it shows the time and the environment steps of one solve and how
+good the learned policy is, compared with the exact policy of value iteration:
+- optimal actions: states where the action of the policy is as good as the best action
+- optimal paths: layouts where the path of the policy from the start state has the best return
+- same as MC: states where the action is the same as the one of the Monte Carlo policy
+Run it from the main folder of the project: python benchmark_policy_solvers.py
+'''
+
+import time
+import sys
+sys.path.insert(0,'dynamic_policy')
+sys.path.insert(0,'extended_dynamic_policy')
+import numpy as np
+import gridworld
+import monte_carlo
+import monte_carlo_5x5
+import monte_carlo_core
+import policy_solvers
+import td_core
+
+N_LAYOUTS = 50
+MAX_OBSTACLES = 5
+SEED = 0
+
+# random end states and obstacles, always the same ones
+def random_layouts(size, n_layouts):
+    rng = np.random.RandomState(SEED)
+    layouts = []
+    for i in range(n_layouts):
+        end_state = tuple(rng.randint(size, size=2))
+        obstacles = [tuple(state) for state in rng.randint(size, size=(rng.randint(MAX_OBSTACLES + 1), 2))]
+        layouts.append((end_state, [state for state in obstacles if state != end_state]))
+    return layouts
+
+# total reward of the path that follows the greedy policy of Q from start, None if it never ends
+def path_return(grid, Q, start):
+    s = grid.state_index(start)
+    total = 0.0
+    for step in range(grid.n_states):
+        if grid.terminal[s]:
+            return total
+        s = grid.next_state[s, Q[s].argmax()]
+        total += grid.reward[s]
+    return None
+
+# Q, number of environment steps and number of episodes of each learner
+def learners(mc):
+    def run_monte_carlo(grid):
+        Q, N, n_truncated, n_episodes, n_steps = monte_carlo_core.run_batched_episodes(
+            grid, mc.START_STATE, mc.EPISODES, mc.MAX_EPISODE_STEPS, mc.GAMMA, mc.EPS, mc.BATCH_SIZE,
+            window=mc.CONVERGENCE_WINDOW, tolerance=mc.CONVERGENCE_TOLERANCE)
+        return Q, n_steps, n_episodes
+    def run_td(sarsa):
+        def run(grid):
+            Q, N, n_truncated, n_episodes, n_steps = td_core.run_td(
+                grid, mc.START_STATE, mc.EPISODES, mc.MAX_EPISODE_STEPS, mc.GAMMA, mc.EPS, mc.LEARNING_RATE, sarsa,
+                mc.BATCH_SIZE, window=mc.CONVERGENCE_WINDOW, tolerance=mc.CONVERGENCE_TOLERANCE)
+            return Q, n_steps, n_episodes
+        return run
+    return [(policy_solvers.MONTE_CARLO, run_monte_carlo),
+            (policy_solvers.Q_LEARNING, run_td(False)),
+            (policy_solvers.SARSA, run_td(True))]
+
+def benchmark(mc):
+    size = mc.GRID_SIZE
+    grids = [gridworld.layout_grid(size, end_state, obstacles, mc.STEP_COST, mc.OBSTACLE_COST)
+             for end_state, obstacles in random_layouts(size, N_LAYOUTS)]
+    exact_Q = [policy_solvers.value_iteration(grid, mc.GAMMA) for grid in grids]
+    mc_actions = None
+    print(f"{size}x{size} grid, {N_LAYOUTS} layouts")
+    print("learner          ms/solve     steps  episodes  optimal actions  optimal paths  same as MC")
+    for name, learn in learners(mc):
+        np.random.seed(SEED)
+        elapsed = steps = episodes = optimal_actions = optimal_paths = same_as_mc = n_states = 0
+        actions = []
+        for grid, Q_star in zip(grids, exact_Q):
+            start = time.perf_counter()
+            Q, n_steps, n_episodes = learn(grid)
+            elapsed += time.perf_counter() - start
+            steps += n_steps
+            episodes += n_episodes
+            free = ~grid.terminal
+            best = Q.argmax(axis=1)
+            optimal_actions += (Q_star[np.arange(grid.n_states), best] >= Q_star.max(axis=1) - 1e-9)[free].sum()
+            n_states += free.sum()
+            best_return = path_return(grid, Q_star, mc.START_STATE)
+            learned_return = path_return(grid, Q, mc.START_STATE)
+            optimal_paths += learned_return is not None and abs(learned_return - best_return) < 1e-9
+            actions.append(best[free])
+        if mc_actions is None:
+            mc_actions = actions
+        same_as_mc = sum((a == b).sum() for a, b in zip(actions, mc_actions))
+        print(f"{name:16}{elapsed / N_LAYOUTS * 1000:9.1f}{steps / N_LAYOUTS:10.0f}{episodes / N_LAYOUTS:10.0f}"
+              f"{optimal_actions / n_states * 100:16.1f}%{optimal_paths / N_LAYOUTS * 100:14.1f}%{same_as_mc / n_states * 100:11.1f}%")
+    print("")
+
+if __name__ == "__main__":
+    for mc in [monte_carlo, monte_carlo_5x5]:
+        benchmark(mc)
@@ -0,0 +1,89 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Clearance map of the obstacles of an episode: the distance from every point of the frame to the
+edge of the nearest obstacle (negative inside an obstacle), used by the Bayesian robot instead of
+checking every obstacle in view (see bayesian/b_robot.py).
+The frame, with a margin of CLEARANCE_MARGIN pixels around it, is divided in cells of cell_size x cell_size pixels
+and the Euclidean distance transform (scipy.ndimage.distance_transform_edt) gives the distance from every cell
+to the nearest cell with the center of an obstacle. It is calculated once per obstacle list (episode), then:
+- the clearance at a point is one array lookup
+- the clearance along a segment is the lowest clearance of the points sampled every cell_size pixels on it
+- the gradient points where the clearance grows fastest, away from the nearest obstacles
+The obstacles are placed in the cell of their center, so the clearances are off by cell_size / sqrt(2) pixels at most.
+'''
+
+import math
+import numpy as np
+from scipy import ndimage
+import constants
+from geometry import dist
+
+class ClearanceMap:
+    def __init__(self, obstacle_list, cell_size=None, margin=None):
+        self.obstacle_list = obstacle_list
+        self.size = len(obstacle_list)
+        self.cell_size = cell_size if cell_size is not None else constants.CLEARANCE_CELL_SIZE
+        self.margin = margin if margin is not None else constants.CLEARANCE_MARGIN
+        self.n_cells = int(math.ceil((constants.FRAME_SIZE + 2 * self.margin) / self.cell_size))
+        free = np.ones((self.n_cells, self.n_cells), dtype=bool)
+        if self.size > 0:
+            cells = self.cells_of(np.array(obstacle_list, dtype=float)[:, :2])
+            free[cells[:, 0], cells[:, 1]] = False
+            # clearance[x, y] is the clearance of cell (x, y), same order as the positions (x, y)
+            self.clearance = ndimage.distance_transform_edt(free) * self.cell_size - constants.OBSTACLE_RAD
+            # gradient of the clearance along x and along y, in pixels of clearance per pixel
+            self.gradient_x, self.gradient_y = np.gradient(self.clearance, self.cell_size)
+        else:
+            self.clearance = np.full((self.n_cells, self.n_cells), np.inf)
+            self.gradient_x = self.gradient_y = np.zeros((self.n_cells, self.n_cells))
+
+    # cell of each point, the points out of the map are in the cells on its border
+    def cells_of(self, points):
+        cells = np.floor((np.asarray(points, dtype=float) + self.margin) / self.cell_size).astype(int)
+        return np.clip(cells, 0, self.n_cells - 1)
+
+    # distance from the point to the edge of the nearest obstacle
+    def clearance_at(self, pos):
+        x, y = self.cells_of(pos[:2])
+        return float(self.clearance[x, y])
+
+    # lowest clearance of the segment from pos to end_pos
+    def segment_clearance(self, pos, end_pos):
+        n_samples = int(dist(pos, end_pos) / self.cell_size) + 2
+        points = np.linspace(pos[:2], end_pos[:2], n_samples)
+        cells = self.cells_of(points)
+        return float(self.clearance[cells[:, 0], cells[:, 1]].min())
+
+    # True if the robot can walk from pos to end_pos keeping at least clearance away from the obstacles
+    def path_is_clear(self, pos, end_pos, clearance):
+        return self.segment_clearance(pos, end_pos) >= clearance
+
+    # (x, y) gradient of the clearance at the point
+    def gradient_at(self, pos):
+        x, y = self.cells_of(pos[:2])
+        return float(self.gradient_x[x, y]), float(self.gradient_y[x, y])
+
+    # True if the map was built for this list and it has not changed size since then
+    def matches(self, obstacle_list):
+        return obstacle_list is self.obstacle_list and len(obstacle_list) == self.size
+
+_last_map = None
+
+# returns the clearance map of the obstacle list. It is built only once per list (episode)
+# and rebuilt when obstacles are added to it
+def map_for(obstacle_list):
+    global _last_map
+    if _last_map is None or not _last_map.matches(obstacle_list):
+        _last_map = ClearanceMap(obstacle_list)
+    return _last_map
@@ -23,6 +23,25 @@ SENSOR_MAX_R = 20 # max range that each sensor can report
 SENSOR_ALERT_R = 20 #range within which sensor reports are acted upon
 TURN_SCALE_FACTOR = 2 # how drastic do we want the turns to be
 SAFETY_DISTANCE = 20 # distance the robot tries to be far from obstacles in Bayesian algo
+TRAJECTORY_MAX_LEN = None # how many positions of the robot are kept for drawing, None keeps all of them
+POLICY_SOLVER = "monte_carlo" # dynamic policies: "monte_carlo", "value_iteration", "q_learning" or "sarsa" (see policy_solvers.py)
+SONAR_MODEL = "lateral" # "lateral": original sonar model, "ray": exact ray-circle ranges (see sonar_engine.py)
+POLICY_STORE = None # file, in the folder of the robot, where the dynamic policies are saved for the next runs (e.g. "policy_store.sqlite"), None keeps them only in memory (see policy_store.py)
+POLICY_CACHE_MAX_ENTRIES = 10000 # dynamic policies kept in memory, the least recently used are removed (see policy_cache.py)
+POLICY_CACHE_MAX_BYTES = 32 * 1024 * 1024 # memory used by the dynamic policies kept in memory
+PREFETCH_PROCESSES = 0 # processes solving the next dynamic policies in the background, 0: no prefetch, None: one less than the CPUs (see policy_prefetch.py)
+FLOW_FIELD_CELL_SIZE = 5 # cells of the flow field of the flow field robot, in pixels (see flow_field.py)
+FLOW_FIELD_CLEARANCE = 25 # the flow field keeps the robot this far from the center of the obstacles when it can
+FLOW_FIELD_INFLATION_COST = 10 # cost of a move closer than FLOW_FIELD_CLEARANCE to an obstacle, 1 elsewhere
+FLOW_FIELD_LOOKAHEAD = 2 # the robot heads to the cell this number of cells ahead on its path to the goal
+FLOW_FIELD_CACHE_SIZE = 100 # flow fields of different environments kept in memory
+PLANNER_OBSTACLE_COST = 1 # dynamic policies: extra cost of a square of the map full of obstacles in the global plan (see map_planner.py)
+PLANNER_CACHE_SIZE = 100 # global plans of different environments kept in memory
+CLEARANCE_MODEL = "sonar" # Bayesian robot: "sonar": sonar outputs and obstacles in view, "edt": clearance map of the episode (see clearance_map.py)
+CLEARANCE_CELL_SIZE = 4 # cells of the clearance map, in pixels
+CLEARANCE_MARGIN = 50 # the clearance map covers this many pixels out of the frame too
+CLEARANCE_LOOKAHEAD = 20 # with the clearance map, the robot checks this many pixels ahead of it
+CLEARANCE_SAFETY = 10 # with the clearance map, the robot keeps this far from the edge of the obstacles
 
 N_SENSOR = 16 # number of sensors
 N_OBSTACLES = 16 # number of obstacles in the test data
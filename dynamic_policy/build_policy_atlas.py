@@ -0,0 +1,66 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Builds the policy atlas of the 4x4 grid (see policy_atlas.py), used by the "atlas" policy solver.
+Every end state and obstacle layout of the grid is solved with the rewards of monte_carlo.py,
+and the result is saved in ATLAS_FILE_NAME.
+Then the atlas is checked against the value_iteration solver on CHECK_LAYOUTS random layouts, both read
+through the canonical layouts like the robot does (see utils.dynamic_policy_finder).
+python build_policy_atlas.py --check only checks the saved atlas.
+'''
+
+import random
+import time
+import sys
+sys.path.insert(0,'..')
+import grid_symmetry
+import gridworld
+import monte_carlo
+import monte_carlo_core
+import policy_atlas
+import policy_solvers
+import utils
+
+CHECK_LAYOUTS = 3000
+
+# policy of the layout calculated by the value_iteration solver, as in monte_carlo.calculate_gridworld_policy
+def value_iteration_policy(end_state, obstacle_states, solver):
+    grid = gridworld.layout_grid(monte_carlo.GRID_SIZE, end_state, obstacle_states, monte_carlo.STEP_COST, monte_carlo.OBSTACLE_COST)
+    return monte_carlo_core.greedy_policy(grid, policy_solvers.value_iteration(grid, monte_carlo.GAMMA))
+
+# number of the random layouts where the atlas and the value_iteration solver have a different action in some state
+def check_atlas(atlas, n_layouts):
+    size = monte_carlo.GRID_SIZE
+    states = [(row, col) for row in range(size) for col in range(size)]
+    n_different = 0
+    for i in range(n_layouts):
+        end_state = random.choice(states)
+        obstacle_states = [state for state in states if state != end_state and random.random() < 0.3]
+        policy, _ = grid_symmetry.cached_policy({}, policy_solvers.VALUE_ITERATION, end_state, obstacle_states, size, value_iteration_policy)
+        if any(policy_atlas.canonical_lookup(atlas, end_state, obstacle_states, state, size) != policy.get(state, ' ') for state in states):
+            n_different += 1
+    return n_different
+
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        atlas = policy_atlas.load(utils.ATLAS_FILE_NAME)
+    else:
+        start = time.time()
+        grid = gridworld.GridWorld(monte_carlo.GRID_SIZE, monte_carlo.GRID_SIZE)
+        atlas = policy_atlas.build(grid.next_state, monte_carlo.GAMMA, monte_carlo.STEP_COST, monte_carlo.OBSTACLE_COST)
+        policy_atlas.save(atlas, utils.ATLAS_FILE_NAME)
+        print(f"{utils.ATLAS_FILE_NAME}: {atlas.shape} policies built in {time.time() - start:.1f}s")
+    n_different = check_atlas(atlas, CHECK_LAYOUTS)
+    print(f"{n_different} of {CHECK_LAYOUTS} random layouts differ from the value_iteration solver")
+    if n_different > 0:
+        sys.exit(1)
@@ -18,6 +18,7 @@ has never seen before.
 '''
 
 import math
+import os
 import random
 import sonar
 import sonar_array
@@ -26,21 +27,28 @@ import sys
 sys.path.insert(0,'..')
 import constants
 import logger
+import geometry
+import obstacle_index
+import policy_store
+import trajectory
 
 # global variables
-master_policy={} # map of environment setup (end state|obstacle array) and policy
+# map of canonical environment setup (policy_solvers.policy_key of the solver, end state and obstacles) and policy, see grid_symmetry.py
+master_policy=policy_store.open_store(constants.POLICY_STORE, utils.montecarlo.POLICY_VERSION, utils.montecarlo.GRID_SIZE,
+                                     constants.POLICY_CACHE_MAX_ENTRIES, constants.POLICY_CACHE_MAX_BYTES, os.path.dirname(os.path.abspath(__file__)))
 I_was_here=[0,0] # not currenly used
 
 # Robot is the agent.
 # It knows its position and the goal position
 class Robot:
-    def __init__(self, pos, co, n_sensor,goal_pos):
+    def __init__(self, pos, co, n_sensor,goal_pos, sonar_model=None, solver=None):
         self.steps = 0
         self.pos = pos
-        self.history = [pos]
+        self.history = trajectory.Trajectory(constants.TRAJECTORY_MAX_LEN)
+        self.history.append(pos)
         self.co = co
         self.spd = 10 # robot speed in pixels/ step
-        self.s_array = sonar_array.Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co)
+        self.s_array = sonar_array.Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co, sonar_model, solver)
         self.goal_brg = utils.brg_in_deg(self.pos, goal_pos)
         self.obstacles_in_view = []
     
@@ -50,10 +58,8 @@ class Robot:
     # this is the most important methond, which moves the agent in the environment
     def update(self, full_obstacle_list, goal_pos):
         self.steps += 1
-        self.obstacles_in_view = [] #delete all the old obstacles in view
-        for obs in full_obstacle_list:
-            if utils.dist(self.pos, obs) < constants.SENSOR_MAX_R:
-                self.obstacles_in_view.append(obs)
+        #replace the old obstacles in view
+        self.obstacles_in_view = obstacle_index.index_for(full_obstacle_list).within(self.pos, self.s_array.view_r)
                 
         #re-calculate direction to goal
         self.goal_brg = utils.brg_in_deg(self.pos, goal_pos)
@@ -79,25 +85,12 @@ class Robot:
 
         #the robot by one step...
         self.move(1)
-        print(f"master_policy.keys()={master_policy.keys()}")
+        utils.prefetch_policies(self.pos, self.co, full_obstacle_list, master_policy, goal_pos, self.s_array.solver)
         return self.has_hit_obstacle(full_obstacle_list), self.has_reached_goal(goal_pos)
 
     #return True if there is a clear path to the goal
     def path_is_clear(self, goal_pos):
-        goal_brg = utils.brg_in_deg(self.pos, goal_pos)
-        for obs in self.obstacles_in_view:
-            if utils.dist(self.pos, goal_pos) > utils.dist(self.pos, obs):
-                d_obs, obs_brg = utils.dist_and_brg_in_deg(self.pos, obs)
-                rel_brg = abs(utils.relative_brg(goal_brg, obs_brg))
-
-                rel_brg_radians = math.radians(rel_brg)
-                if rel_brg_radians < -1 or rel_brg_radians > 1:
-                    return False
-
-                d_lateral = abs(d_obs * math.asin(math.radians(rel_brg)))
-                if d_lateral < constants.OBSTACLE_RAD + constants.ROBOT_RAD: 
-                    return False
-        return True
+        return geometry.path_is_clear(self.pos, goal_pos, self.obstacles_in_view)
     
     def move(self, dT):
         u_vec = utils.angle_to_vector(self.co)
@@ -105,7 +98,7 @@ class Robot:
         self.pos[0] += self.spd * dT * u_vec[1]
         self.pos[1] -= self.spd * dT * u_vec[0]
         
-        self.history.append([self.pos[0], self.pos[1]])
+        self.history.append(self.pos)
         
     def get_pos(self):
         return self.pos
@@ -117,7 +110,7 @@ class Robot:
         self.co = co
     
     def delete_history(self):
-        self.history = []
+        self.history.clear()
 
     # draw the robot in the ui
     def draw(self, canvas):
@@ -146,17 +139,9 @@ class Robot:
     # detect if the robot has hit an obstacle
     def has_hit_obstacle(self, full_obstacle_list):
         logger.log(f"self.pos={self.pos}, full_obstacle_list={full_obstacle_list}")
-        x = self.pos[0]
-        y = self.pos[1]
-        radius = constants.OBSTACLE_RAD
-
-        for obstacle_pos in full_obstacle_list:
-            center_x = obstacle_pos[0]
-            center_y = obstacle_pos[1]
-            logger.log(f"x={x}, y={y}, center_x={center_x}, center_y={center_y}")
-            if (x - center_x)**2 + (y - center_y)**2 < radius**2:
-                print("WE HIT THE OBSTACLE! START CRYING!!!!")
-                return True
+        if len(obstacle_index.index_for(full_obstacle_list).within(self.pos, constants.OBSTACLE_RAD)) > 0:
+            print("WE HIT THE OBSTACLE! START CRYING!!!!")
+            return True
         return False
 
     # detect if the robot has reached the goal
@@ -136,4 +136,7 @@ f1.set_draw_handler(draw)
 f1.set_mouseclick_handler(click)
 
 #start simplegui
-f1.start() # after this point the application is event oriented
\ No newline at end of file
+f1.start() # after this point the application is event oriented
+
+# the window was closed, stop the workers solving policies in the background
+utils.prefetcher.terminate()
\ No newline at end of file
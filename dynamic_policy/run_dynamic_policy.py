@@ -88,6 +88,9 @@ for i in range(constants.N_EPISODES):
     episodes_data["steps1"].append(step_number1)
     episodes_data["success1"].append(reach_goal1)
 
+# stop the workers solving policies in the background
+utils.prefetcher.terminate()
+
 print("Final result")
 print("------------")
 print("Episode: ", episodes_data["episode"])
@@ -29,7 +29,7 @@ class Sonar:
         self.max_r = max_r
         self.offset =  index * FOV #+ FOV/2 # on what relative bearing is this sensor looking?
         self.look_brg = (robot_co + self.offset)%360
-        self.vec = [0,0] # just a vector for grpahical ouptut of pings
+        self.output = constants.SENSOR_MAX_R
         self.has_valid_echo = False #indicates if this sonar has a "valid" obstacle in sight
         #print "Creating Sonar:" , index, " offset ", self.offset, "true LOS:", self.look_brg
             
@@ -93,9 +93,21 @@ class Sonar:
         
         self.ping_simulated(obstacle_list, platform_co)
         
-        self.vec = utils.create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)#calculate distance vector for drawing on canvas
-        
         #print "sensor index:", self.index, " look brg:", self.look_brg
+    def set_output(self, platform_pos, platform_co, output, has_valid_echo):
+        #store the output calculated for this sensor by the batched sonar engine
+        self.set_pose(platform_pos, platform_co)
+        self.output = output
+        self.has_valid_echo = has_valid_echo
+
+    def set_pose(self, platform_pos, platform_co):
+        self.pos = platform_pos
+        self.look_brg = (platform_co + self.offset)%360
+
+    @property
+    def vec(self): # just a vector for grpahical ouptut of pings, only calculated when the sonar is drawn
+        return utils.create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)
+
     def draw(self, canvas): # draw the sensor's output
         #if self.has_valid_echo:
         canvas.draw_line(self.pos,self.vec, 1, 'lime')
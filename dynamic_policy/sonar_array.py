@@ -18,6 +18,7 @@ import math
 import random
 import sonar
 import constants
+import sonar_engine
 import utils
 
 EPISILON = 0.05
@@ -30,7 +31,7 @@ def skip_the_policy():
 
 # It has some utility functions for the group of sensors
 class Sonar_Array:
-    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co):
+    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co, model=None, solver=None):
         self.sonar_list = []
         self.need_diversion_flag = False
         self.n_sensor = n_sensor
@@ -43,12 +44,25 @@ class Sonar_Array:
         
         for i in i_pos:#create a list of individual sonars...
             self.sonar_list.append(sonar.Sonar(i, SENSOR_FOV, SENSOR_MAX_R, robot_co))
+        self.max_r = SENSOR_MAX_R
+        self.offsets = [s.offset for s in self.sonar_list]
+        self.model = model or constants.SONAR_MODEL # see sonar_engine.py
+        self.view_r = sonar_engine.view_radius(self.model) # obstacles closer than this can be seen
+        self.ping_cache = sonar_engine.PingCache()
+        self.solver = solver # policy solver, see policy_solvers.py
+        self.pos = [0,0]
+        self.co = robot_co
    
     # called by the robot to get the direction of the next movement
     def update(self, robot_pos, robot_co, obstacle_list, method,full_obstacle_list,master_policy,I_was_here,goal_pos):
-        #update sonar array
-        for sonar in self.sonar_list:#update output of each sensor
-            sonar.update(robot_pos, robot_co, obstacle_list)
+        self.pos = robot_pos
+        self.co = robot_co
+        #update sonar array, all the sensors against all the obstacles in one batched pass
+        #skipped if the outputs are still the same (e.g. no obstacles in view)
+        if self.ping_cache.is_stale(robot_pos, robot_co, obstacle_list):
+            outputs, echoes = sonar_engine.ping(robot_pos, robot_co, self.offsets, obstacle_list, self.max_r, self.model)
+            for sonar, output, echo in zip(self.sonar_list, outputs, echoes):#update output of each sensor
+                sonar.set_output(robot_pos, robot_co, float(output), bool(echo))
             
         return self.weighted_sum_method(robot_pos, robot_co,full_obstacle_list,master_policy,I_was_here,goal_pos)
 
@@ -69,11 +83,8 @@ class Sonar_Array:
         sum_d = 0
         sum_wt = 0
         alert = False
-        obs=[]
         
-        obs=utils.check_obstacle(robot_pos,full_obstacle_list)
-               
-        action = utils.dynamic_policy_finder(robot_pos,obs,master_policy,goal_pos)
+        action = utils.dynamic_policy_finder(robot_pos,full_obstacle_list,master_policy,goal_pos,self.solver)
         print(f"action={action},")
         if action == 'R':
             print ("policy recommend to go right ")
@@ -101,4 +112,5 @@ class Sonar_Array:
     # draw the sonar
     def draw(self, canvas):
         for sonar in self.sonar_list:
+            sonar.set_pose(self.pos, self.co)#the sensors are not updated when the ping is skipped
             sonar.draw(canvas)
\ No newline at end of file
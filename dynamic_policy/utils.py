@@ -17,71 +17,27 @@ Utility functions used by several other files
 import math
 import monte_carlo as montecarlo
 import numpy as np
+import os
 import random
 import sys
 sys.path.insert(0,'..')
 import constants
+import grid_symmetry
 import logger
+import map_planner
+import obstacle_index
+import occupancy_map
+import policy_atlas
+import policy_prefetch
+import policy_solvers
+from geometry import brg_in_deg, dist, relative_brg, angle_to_vector, create_vector, dist_and_brg_in_deg, rel_brg_fm_offset_sensor
 
-def brg_in_deg(p0, p1):#bearing only in degrees
-    [x1, y1] = p0
-    [x2, y2] = p1
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return b
-
-def dist(p1, p0):#distance only
-    return math.sqrt((p1[0] - p0[0])**2+(p1[1]-p0[1])**2)
-
-def relative_brg(b1, b2):
-    rb = b2 - b1
-    if rb > 180:
-        rb = 360 - rb
-    if rb < -180:
-        rb += 360
-        rb *= -1
-    return rb
-
-def angle_to_vector(ang):#resolve angles into vectors
-    ang = math.radians(ang)
-    return [math.cos(ang), math.sin(ang)]
-
-def create_vector(from_pos, length, brg):       
-        u_vec = angle_to_vector(brg)
-        #print "generating target line..."
-        vec0 = from_pos[0] + length * u_vec[1] 
-        vec1 = from_pos[1] - length * u_vec[0]
-        
-        return [vec0, vec1]
-
-def dist_and_brg_in_deg(p0, p1):#bearing and distance in degrees between two points
-    [x1, y1] = p0
-    [x2, y2] = p1
-    r = math.sqrt((x1 - x2)**2 + (y1 - y2)**2) # distance
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return r, b
+# created by build_policy_atlas.py in the dynamic_policy folder, found there whatever the current directory
+ATLAS_FILE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policy_atlas_4x4.npy")
 
-def rel_brg_fm_offset_sensor(true_hdg, sensor_offset, tgt_brg):
-    #given robot's true heading, the sensor offset angle and the
-    #true brg of the target, this fn will return the relative brg
-    #of the target from the sensor's line of sight
-    
-    sensor_look_brg = (true_hdg + sensor_offset)%360
-    tgt_rel_fm_sensor = tgt_brg - sensor_look_brg
-
-    if tgt_rel_fm_sensor < -180:
-        tgt_rel_fm_sensor += 360
-    
-    return tgt_rel_fm_sensor
+# solves in the background the layouts of the squares the robot is expected to enter next, see prefetch_policies
+prefetcher = policy_prefetch.PolicyPrefetcher(montecarlo.GRID_SIZE, montecarlo.calculate_gridworld_policy,
+                                              constants.PREFETCH_PROCESSES)
 
 
 # this function to find the location of agent or obtacles in the map 
@@ -103,115 +59,72 @@ def find_location_onMap(pos):
     return location_in_the_map, location_in_the_grid
 
 # will check if there is a policy for this position in the grid, if not, it will be created
-# return the action that should be taked, according with the policy
-def dynamic_policy_finder (mylocation, obs, master_policy, goal_pos):
-    print(f"mylocation={mylocation}, obs={obs}, goal_pos={goal_pos}")
+# return the action that should be taked, according with the policy.
+# obs is the obstacle list of the episode
+def dynamic_policy_finder (mylocation, obs, master_policy, goal_pos, solver=None):
+    print(f"mylocation={mylocation}, goal_pos={goal_pos}")
     
     mylocation_onMap, my_location_onGrid = find_location_onMap(mylocation)
     print(f"mylocation_onMap={mylocation_onMap}, my_location_onGrid={my_location_onGrid}")
 
-    obs_location_onGrid_array = []
-
-    for obstacle_pos in obs:
-        obs_location_onGrid_array.extend(calculate_obstacle_onGrid(mylocation_onMap, obstacle_pos))
-        logger.log(f"obs_location_onGrid_array={obs_location_onGrid_array}")
+    obs_location_onGrid_array = calculate_obstacles_onGrid(mylocation_onMap, obs)
+    logger.log(f"obs_location_onGrid_array={obs_location_onGrid_array}")
     
-    end_state = calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos)
-
-    policy_key = f"{end_state}|{obs_location_onGrid_array}"
-    print(f"policy_key={policy_key}")
-
-    if policy_key in master_policy:
-        policy = master_policy[policy_key]
-        print("Saved policy:")
-        montecarlo.print_policy_without_grid(policy)
-    else:
-        policy = runMonteCarlo(end_state, obs_location_onGrid_array)
-        master_policy[policy_key] = policy
-        print("Created policy:")
-        montecarlo.print_policy_without_grid(policy)
+    end_state = calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos, obs)
+
+    solver = solver or constants.POLICY_SOLVER
+    if solver == policy_solvers.ATLAS:
+        # every layout has already been solved, the action is read from the atlas for the canonical layout,
+        # so it is the same as the value_iteration solver (see build_policy_atlas.check_atlas)
+        direction = policy_atlas.canonical_lookup(policy_atlas.load(ATLAS_FILE_NAME), invertCoordinate(end_state),
+                                                  [invertCoordinate(location) for location in obs_location_onGrid_array],
+                                                  invertCoordinate((my_location_onGrid[0],my_location_onGrid[1])), montecarlo.GRID_SIZE)
+        print(f"direction={direction}")
+        return direction
+
+    # master_policy has the policies of the canonical layouts, a rotated or mirrored layout
+    # reuses the same policy (see grid_symmetry.py). A layout solved in the background is not solved again
+    prefetcher.collect(master_policy)
+    policy, saved = grid_symmetry.cached_policy(master_policy, solver, invertCoordinate(end_state),
+                                                [invertCoordinate(location) for location in obs_location_onGrid_array],
+                                                montecarlo.GRID_SIZE, prefetcher.solve)
+    print("Saved policy:" if saved else "Created policy:")
+    montecarlo.print_policy_without_grid(policy)
 
     direction = policy.get(invertCoordinate((my_location_onGrid[0],my_location_onGrid[1])), ' ')
     print(f"direction={direction}")
     return direction
 
+# layout (end state and obstacles) of the grid of a square the robot is expected to enter next, calculated
+# like in dynamic_policy_finder with the robot in the center of the square.
+# A square whose best end states are all taken by obstacles is skipped, its end state would be random
+def prefetch_layout(square, full_obstacle_list, goal_pos):
+    center = map_planner.square_center(square)
+    obs_location_onGrid_array = calculate_obstacles_onGrid(square, full_obstacle_list)
+    end_states = [state for state in getBestEndState(center, next_waypoint(center, full_obstacle_list, goal_pos)) if state not in obs_location_onGrid_array]
+    if len(end_states) == 0:
+        return None
+    return end_states[0], obs_location_onGrid_array
+
+# starts solving in the background the layouts of the squares the robot is expected to enter next
+# (see policy_prefetch.py), so they are ready when dynamic_policy_finder needs them
+def prefetch_policies(mylocation, co, full_obstacle_list, master_policy, goal_pos, solver=None):
+    solver = solver or constants.POLICY_SOLVER
+    prefetcher.prefetch_next(master_policy, solver, mylocation, co, full_obstacle_list, goal_pos,
+                             lambda square: prefetch_layout(square, full_obstacle_list, goal_pos))
+
 # The obstacle can be in more than one space in the grid
-#           U
-#         L O R 
-#           D  
-def calculate_obstacle_onGrid(mylocation_onMap, obstacle_pos):
-    logger.log(f"calculate_obstacle_onGrid - obstacle_pos={obstacle_pos}", True)
-    obs_location_onGrid_array = []
-    obs_onMap, obs_onGrid = find_location_onMap(obstacle_pos)
-    logger.log(f"calculate_obstacle_onGrid - mylocation_onMap={mylocation_onMap}, obs_onGrid={obs_onGrid}", True)
-
-    if mylocation_onMap == obs_onMap:
-        obs_location_onGrid_array.append((obs_onGrid[0],obs_onGrid[1]))
-        print(f"Robot and obstacle are in the same grid on the map")
-    else:
-        print(f"Robot and obstacle are NOT in the same grid on the map")
-
-    # Up
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]-constants.OBSTACLE_RAD,obstacle_pos[1]])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - U border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added U border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # Down
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]+constants.OBSTACLE_RAD,obstacle_pos[1]])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - D border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added D border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # Left 
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0],obstacle_pos[1]-constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - L border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added L border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # Right
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0],obstacle_pos[1]+constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - R border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added R border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # North West
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]-constants.OBSTACLE_RAD,obstacle_pos[1]-constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - NW border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added NW border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # North East
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]-constants.OBSTACLE_RAD,obstacle_pos[1]+constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - NE border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added NE border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # South West
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]+constants.OBSTACLE_RAD,obstacle_pos[1]-constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - SW border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added SW border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-    # South East
-    border_obs_onMap, border_obs_onGrid = find_location_onMap([obstacle_pos[0]+constants.OBSTACLE_RAD,obstacle_pos[1]+constants.OBSTACLE_RAD])
-    border_obs_onGrid = (border_obs_onGrid[0],border_obs_onGrid[1])
-    logger.log(f"calculate_obstacle_onGrid - SE border_obs_onMap={border_obs_onMap}, border_obs_onGrid={border_obs_onGrid}")
-    if border_obs_onMap == mylocation_onMap and (border_obs_onGrid not in obs_location_onGrid_array):
-        logger.log(f"calculate_obstacle_onGrid - added SE border_obs_onGrid={border_obs_onGrid}")
-        obs_location_onGrid_array.append(border_obs_onGrid)
-
-    return obs_location_onGrid_array
+#         NW U NE
+#          L O R 
+#         SW D SE
+# the spaces of the grid of the square of the map with an obstacle, read from the occupancy map
+# of the obstacle list, built once per episode (see occupancy_map.py)
+def calculate_obstacles_onGrid(mylocation_onMap, obstacle_list):
+    occupancy = occupancy_map.map_for(obstacle_list, 4, occupancy_map.STAR)
+    return occupancy.occupied_in(mylocation_onMap[0] * 4, mylocation_onMap[1] * 4, 4)
 
 # finds the best spot for the end state considering the obstacles and the goal position
-def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
+def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos, obstacle_list):
 
     logger.log(f"obs_location_onGrid_array={obs_location_onGrid_array}")
 
@@ -226,7 +139,7 @@ def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
             all_end_states.remove(state)   
     print(f"mylocation={mylocation}, goal_pos={goal_pos}, all_end_states={all_end_states}")
 
-    best_end_states = getBestEndState(mylocation, goal_pos)
+    best_end_states = getBestEndState(mylocation, next_waypoint(mylocation, obstacle_list, goal_pos))
     print(f"best_end_states={best_end_states}")
     for state in best_end_states:
         if state not in obs_location_onGrid_array:
@@ -249,7 +162,14 @@ def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
 
     return end_state     
 
-# returns a list of the best places for the end state
+# position the local policy aims at: the next square of the global plan to the goal,
+# around the obstacles out of the local grid too (see map_planner.py), or the goal when it is closer
+def next_waypoint(mylocation, obstacle_list, goal_pos):
+    waypoint = map_planner.planner_for(obstacle_list, goal_pos).waypoint(mylocation, goal_pos)
+    print(f"next_waypoint - mylocation={mylocation}, waypoint={waypoint}")
+    return waypoint
+
+# returns a list of the best places for the end state, towards goal_pos (the goal or the next waypoint)
 def getBestEndState(mylocation, goal_pos):
     robot_onMap, _ = find_location_onMap(mylocation)
     goal_onMap, _ = find_location_onMap(goal_pos)
@@ -336,20 +256,11 @@ def isNearby(pos1, pos2):
 # 150x150px
 def check_obstacle(pos, obs_list):
   logger.log(f"check_obstacle - pos={pos}")  
-  obstacles=[]
   robot_loc_onMap, _ = find_location_onMap(pos)
   logger.log(f"check_obstacle - robot_loc_onMap={robot_loc_onMap}")
-  for i in obs_list:
-    obs_loc_onMap, _ = find_location_onMap(i)
-    logger.log(f"check_obstacle - obs_loc_onMap={obs_loc_onMap}")
-
-    if isNearby(robot_loc_onMap, obs_loc_onMap):
-      logger.log(f"obs_loc_onMap {obs_loc_onMap} is near to robot_loc_onMap {robot_loc_onMap}")
-      obstacles.append(i)
-    else: 
-      logger.log(f"obs_loc_onMap {obs_loc_onMap} is NOT near to robot_loc_onMap {robot_loc_onMap}")
-
-    logger.log(f"check_obstacle - obstacles={obstacles}")
+  # only the obstacles in the 3x3 squares around the robot are nearby
+  obstacles = obstacle_index.index_for(obs_list).in_cells(robot_loc_onMap, 1)
+  logger.log(f"check_obstacle - obstacles={obstacles}")
 
   return obstacles    
 
@@ -359,20 +270,11 @@ def check_obstacle_in_this_grid(pos, obs_list):
   logger.log(f"check_obstacle_in_this_grid - pos={pos}", True)  
   mylocation_onMap, _ = find_location_onMap(pos)
 
-  obs_location_onGrid_array = []
-
-  for obstacle_pos in obs_list:
-    obs_location_onGrid_array.extend(calculate_obstacle_onGrid(mylocation_onMap, obstacle_pos))
+  obs_location_onGrid_array = calculate_obstacles_onGrid(mylocation_onMap, obs_list)
   print(f"obs_location_onGrid_array={obs_location_onGrid_array}")
 
   return len(obs_location_onGrid_array) > 0  
   
-# Inverte x and y and run monte carlo
-def runMonteCarlo(end_state, obs_location_onMap_array):
-    newEndState = invertCoordinate(end_state)
-    newObs_location_onMap_array = [invertCoordinate(location) for location in obs_location_onMap_array]
-    return montecarlo.calculate_gridworld_policy(newEndState, newObs_location_onMap_array)
-
 # in the robot world x is col and y is row, but in montecarlo it is the oposite 
 def invertCoordinate(pos):
     return (pos[1],pos[0])
\ No newline at end of file
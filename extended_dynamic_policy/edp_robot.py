@@ -16,6 +16,7 @@ This robot uses a Monte Carlo policy to walk.
 The policy is dynamically calculated when the Grid setup (end state position and obstacles) 
 has never seen before.
 The Grid created by this robor is 5x5 elements of 50px each. Total area is 250x250px.
+(GRID_SIZE in monte_carlo_5x5.py, any odd size works: 7x7, 9x9...)
 Actions are taken only if the internal 3x3 elements have obstacles.
 Policies are cached considering the internal 3x3 grid to allow the policy reuse
 '''
@@ -29,21 +30,26 @@ import sys
 sys.path.insert(0,'..')
 import constants
 import logger
+import geometry
+import obstacle_index
+import policy_cache
+import trajectory
 
 # global variables
-master_policy={} # map of environment setup (end state|obstacle array) and policy
+master_policy=policy_cache.LRUCache(constants.POLICY_CACHE_MAX_ENTRIES, constants.POLICY_CACHE_MAX_BYTES) # map of environment setup (solver|square of the map) and policy
 I_was_here=[0,0] # not currenly used
 
 # Robot is the agent.
 # It knows its position and the goal position
 class Robot:
-    def __init__(self, pos, co, n_sensor,goal_pos):
+    def __init__(self, pos, co, n_sensor,goal_pos, sonar_model=None, solver=None):
         self.steps = 0
         self.pos = pos
-        self.history = [pos]
+        self.history = trajectory.Trajectory(constants.TRAJECTORY_MAX_LEN)
+        self.history.append(pos)
         self.co = co
         self.spd = 10 # robot speed in pixels/ step
-        self.s_array = sonar_array.Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co)
+        self.s_array = sonar_array.Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co, sonar_model, solver)
         self.goal_brg = utils.brg_in_deg(self.pos, goal_pos)
         self.obstacles_in_view = []
         self.prev_full_obstacle_list_size=0
@@ -59,10 +65,8 @@ class Robot:
             self.prev_full_obstacle_list_size = len(full_obstacle_list)
             master_policy.clear()
 
-        self.obstacles_in_view = [] #delete all the old obstacles in view
-        for obs in full_obstacle_list:
-            if utils.dist(self.pos, obs) < constants.SENSOR_MAX_R:
-                self.obstacles_in_view.append(obs)
+        #replace the old obstacles in view
+        self.obstacles_in_view = obstacle_index.index_for(full_obstacle_list).within(self.pos, self.s_array.view_r)
                 
         #re-calculate direction to goal
         self.goal_brg = utils.brg_in_deg(self.pos, goal_pos)
@@ -82,7 +86,7 @@ class Robot:
 
         #the robot by one step...
         self.move(1)
-        print(f"master_policy.keys()={master_policy.keys()}")
+        utils.prefetch_policies(self.pos, self.co, full_obstacle_list, master_policy, goal_pos, self.s_array.solver)
         return self.has_hit_obstacle(full_obstacle_list), self.has_reached_goal(goal_pos)
 
     def move(self, dT):
@@ -93,7 +97,7 @@ class Robot:
         self.pos[0] += self.spd * dT * u_vec[1]
         self.pos[1] -= self.spd * dT * u_vec[0]
         
-        self.history.append([self.pos[0], self.pos[1]])
+        self.history.append(self.pos)
         
     def get_pos(self):
         return self.pos
@@ -105,7 +109,7 @@ class Robot:
         self.co = co
     
     def delete_history(self):
-        self.history = []
+        self.history.clear()
    
     # draw the robot in the ui
     def draw(self, canvas):
@@ -134,17 +138,9 @@ class Robot:
     # detect if the robot has hit an obstacle
     def has_hit_obstacle(self, full_obstacle_list):
         logger.log(f"self.pos={self.pos}, full_obstacle_list={full_obstacle_list}")
-        x = self.pos[0]
-        y = self.pos[1]
-        radius = constants.OBSTACLE_RAD
-
-        for obstacle_pos in full_obstacle_list:
-            center_x = obstacle_pos[0]
-            center_y = obstacle_pos[1]
-            logger.log(f"x={x}, y={y}, center_x={center_x}, center_y={center_y}")
-            if (x - center_x)**2 + (y - center_y)**2 < radius**2:
-                print("WE HIT THE OBSTACLE! START CRYING!!!!")
-                return True
+        if len(obstacle_index.index_for(full_obstacle_list).within(self.pos, constants.OBSTACLE_RAD)) > 0:
+            print("WE HIT THE OBSTACLE! START CRYING!!!!")
+            return True
         return False
 
     # detect if the robot has reached the goal
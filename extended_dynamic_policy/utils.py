@@ -17,71 +17,31 @@ Utility functions used by several other files
 import math
 import monte_carlo_5x5 as montecarlo
 import numpy as np
+import os
 import random
 import sys
 sys.path.insert(0,'..')
 import constants
+import grid_symmetry
 import logger
-
-def brg_in_deg(p0, p1):#bearing only in degrees
-    [x1, y1] = p0
-    [x2, y2] = p1
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return b
-
-def dist(p1, p0):#distance only
-    return math.sqrt((p1[0] - p0[0])**2+(p1[1]-p0[1])**2)
-
-def relative_brg(b1, b2):
-    rb = b2 - b1
-    if rb > 180:
-        rb = 360 - rb
-    if rb < -180:
-        rb += 360
-        rb *= -1
-    return rb
-
-def angle_to_vector(ang):#resolve angles into vectors
-    ang = math.radians(ang)
-    return [math.cos(ang), math.sin(ang)]
-
-def create_vector(from_pos, length, brg):       
-        u_vec = angle_to_vector(brg)
-        #print "generating target line..."
-        vec0 = from_pos[0] + length * u_vec[1] 
-        vec1 = from_pos[1] - length * u_vec[0]
-        
-        return [vec0, vec1]
-
-def dist_and_brg_in_deg(p0, p1):#bearing and distance in degrees between two points
-    [x1, y1] = p0
-    [x2, y2] = p1
-    r = math.sqrt((x1 - x2)**2 + (y1 - y2)**2) # distance
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return r, b
-
-def rel_brg_fm_offset_sensor(true_hdg, sensor_offset, tgt_brg):
-    #given robot's true heading, the sensor offset angle and the
-    #true brg of the target, this fn will return the relative brg
-    #of the target from the sensor's line of sight
-    
-    sensor_look_brg = (true_hdg + sensor_offset)%360
-    tgt_rel_fm_sensor = tgt_brg - sensor_look_brg
-
-    if tgt_rel_fm_sensor < -180:
-        tgt_rel_fm_sensor += 360
-    
-    return tgt_rel_fm_sensor
+import map_planner
+import obstacle_index
+import occupancy_map
+import policy_prefetch
+import policy_store
+from geometry import brg_in_deg, dist, relative_brg, angle_to_vector, create_vector, dist_and_brg_in_deg, rel_brg_fm_offset_sensor
+
+# the grid is GRID_SIZE x GRID_SIZE squares of the map (GRID_SIZE odd) with the robot in the center,
+# CENTER squares away from the borders of the grid, the last row and column are LAST
+CENTER = montecarlo.GRID_SIZE // 2
+LAST = montecarlo.GRID_SIZE - 1
+
+# policies of the canonical layouts (see grid_symmetry.py), shared by all the squares of the map and all the episodes
+layout_policy = policy_store.open_store(constants.POLICY_STORE, montecarlo.POLICY_VERSION, montecarlo.GRID_SIZE,
+                                       constants.POLICY_CACHE_MAX_ENTRIES, constants.POLICY_CACHE_MAX_BYTES, os.path.dirname(os.path.abspath(__file__)))
+# solves in the background the layouts of the squares the robot is expected to enter next, see prefetch_policies
+prefetcher = policy_prefetch.PolicyPrefetcher(montecarlo.GRID_SIZE, montecarlo.calculate_gridworld_policy,
+                                              constants.PREFETCH_PROCESSES)
 
 # this function to find the location of agent or obtacles in the map 
 # it convert 500X500 pixels word to 10x10 squares each with 50x50 pixxels
@@ -96,33 +56,35 @@ def find_location_onMap(pos):
     print(f"location_in_the_map={location_in_the_map}")
     return location_in_the_map, None
 
-# robot pos is always (2,2) in the grid
+# robot pos is always (CENTER,CENTER) in the grid
 def find_location_onGrid(robot_pos_onMap, pos_onMap):
     grid_x = robot_pos_onMap[0] - pos_onMap[0]
     grid_y = robot_pos_onMap[1] - pos_onMap[1]
     if grid_x > 0:
-        grid_x = 2 - grid_x
+        grid_x = CENTER - grid_x
     else:
-        grid_x = 2 + abs(grid_x)    
+        grid_x = CENTER + abs(grid_x)    
     if grid_y > 0:
-        grid_y = 2 - grid_y
+        grid_y = CENTER - grid_y
     else:
-        grid_y = 2 + abs(grid_y)    
+        grid_y = CENTER + abs(grid_y)    
     return (grid_x,grid_y)
 
 # will check if there is a policy for this position in the grid, if not, it will be created
-# return the action that should be taked, according with the policy
-def dynamic_policy_finder (mylocation, obs, master_policy, goal_pos):
-    print(f"dynamic_policy_finder - mylocation={mylocation}, obs={obs}, goal_pos={goal_pos}")
+# return the action that should be taked, according with the policy.
+# obs is the obstacle list of the episode
+def dynamic_policy_finder (mylocation, obs, master_policy, goal_pos, solver=None):
+    print(f"dynamic_policy_finder - mylocation={mylocation}, goal_pos={goal_pos}")
     
     mylocation_onMap, _ = find_location_onMap(mylocation)
     print(f"dynamic_policy_finder - mylocation_onMap={mylocation_onMap}")
 
-    policy_key = f"{mylocation_onMap}"
+    solver = solver or constants.POLICY_SOLVER
+    policy_key = f"{solver}|{mylocation_onMap}"
     #policy_key = f"{end_state}|{obs_location_onMap_array}"
     print(f"policy_key={policy_key}")
 
-    current_state_on_grid = (2,2)
+    current_state_on_grid = (CENTER,CENTER)
     if policy_key in master_policy:
         pos_onPolicy = master_policy[policy_key][0]
         policy = master_policy[policy_key][1]
@@ -133,115 +95,104 @@ def dynamic_policy_finder (mylocation, obs, master_policy, goal_pos):
         print(f"inverted current_state_on_grid={current_state_on_grid}")
         montecarlo.print_policy_without_grid(policy)
     else:
-        obs_location_onMap_array = []
-
-        for obstacle_pos in obs:
-            obs_location_onMap_array.extend(calculate_obstacle_onMap(mylocation_onMap, obstacle_pos))
-            print(f"obs_location_onMap_array={obs_location_onMap_array}")
-        
-        addOutOfBoundsAsObstacles(mylocation_onMap, obs_location_onMap_array)
+        obs_location_onMap_array = calculate_obstacles_onGrid(mylocation_onMap, obs)
+        print(f"obs_location_onMap_array={obs_location_onMap_array}")
     
-        # monte carlo does not work well if 2,2 has obstacle
-        if (2,2) in obs_location_onMap_array:
-            obs_location_onMap_array.remove((2,2))
-            print(f"dynamic_policy_finder - (2,2) is removed")
-
-        end_state = calculate_end_state_onGrid(mylocation, obs_location_onMap_array, goal_pos)
-
-        policy = runMonteCarlo(end_state, obs_location_onMap_array)
+        # monte carlo does not work well if the center has obstacle
+        if (CENTER,CENTER) in obs_location_onMap_array:
+            obs_location_onMap_array.remove((CENTER,CENTER))
+            print(f"dynamic_policy_finder - ({CENTER},{CENTER}) is removed")
+
+        end_state = calculate_end_state_onGrid(mylocation, obs_location_onMap_array, goal_pos, obs)
+
+        # a layout, or a rotated or mirrored one, that was already solved, or that is being solved
+        # in the background, is not solved again
+        prefetcher.collect(layout_policy)
+        policy, _ = grid_symmetry.cached_policy(layout_policy, solver, invertCoordinate(end_state),
+                                                [invertCoordinate(location) for location in obs_location_onMap_array],
+                                                montecarlo.GRID_SIZE, prefetcher.solve)
         for x in range(-1,2,1):
             for y in range(-1,2,1):
-                master_policy[f"{[x+mylocation_onMap[0],y+mylocation_onMap[1]]}"] = [mylocation_onMap, policy]
+                master_policy[f"{solver}|{[x+mylocation_onMap[0],y+mylocation_onMap[1]]}"] = [mylocation_onMap, policy]
 
     direction = policy.get(current_state_on_grid, ' ')
     print(f"direction={direction}")
     return direction
 
-# detects if the position is out of the 5x5 grid
+# layout (end state and obstacles) of the grid of a square the robot is expected to enter next, calculated
+# like in dynamic_policy_finder with the square in the center of the grid.
+# The squares that already have a policy in master_policy and the square of the goal are skipped,
+# and so are the ones whose best end states are all taken by obstacles, their end state would be random
+def prefetch_layout(square, full_obstacle_list, goal_pos, master_policy, solver):
+    goal_onMap, _ = find_location_onMap(goal_pos)
+    # dynamic_policy_finder is not used in the square of the goal
+    if square == goal_onMap or f"{solver}|{square}" in master_policy:
+        return None
+    center = map_planner.square_center(square)
+    obs_location_onMap_array = calculate_obstacles_onGrid(square, full_obstacle_list)
+    if (CENTER,CENTER) in obs_location_onMap_array:
+        obs_location_onMap_array.remove((CENTER,CENTER))
+    goal_onGrid = find_location_onGrid(square, goal_onMap)
+    if isOutOfBounds(goal_onGrid[0], goal_onGrid[1]) == False:
+        end_state = goal_onGrid
+        if end_state in obs_location_onMap_array:
+            obs_location_onMap_array.remove(end_state)
+        return end_state, obs_location_onMap_array
+    end_states = [state for state in getBestEndState(center, next_waypoint(center, full_obstacle_list, goal_pos)) if state not in obs_location_onMap_array]
+    if len(end_states) == 0:
+        return None
+    return end_states[0], obs_location_onMap_array
+
+# starts solving in the background the layouts of the squares the robot is expected to enter next
+# (see policy_prefetch.py), so they are ready when dynamic_policy_finder needs them
+def prefetch_policies(mylocation, co, full_obstacle_list, master_policy, goal_pos, solver=None):
+    solver = solver or constants.POLICY_SOLVER
+    prefetcher.prefetch_next(layout_policy, solver, mylocation, co, full_obstacle_list, goal_pos,
+                             lambda square: prefetch_layout(square, full_obstacle_list, goal_pos, master_policy, solver))
+
+# detects if the position is out of the grid
 def isOutOfBounds(x,y):
     print(f"isOutOfBounds - x={x}, y={y}")
-    if x < 0 or x > 4 or y < 0 or y > 4:
+    if x < 0 or x > LAST or y < 0 or y > LAST:
         return True
     return False
 
-# OOB has to be considered obstacles
-# Robot is always in the center of the 5x5 grid, so there is a padding
-def addOutOfBoundsAsObstacles(mylocation_onMap, obs_location_onGrid_array):
-    print(f"addOutOfBoundsAsObstacles - mylocation_onMap={mylocation_onMap}")
-    robot_x = mylocation_onMap[0]
-    robot_y = mylocation_onMap[1]
-    for x in range(-2,3,1):
-        for y in range(-2,3,1):
-            obs_x = robot_x + x
-            obs_y = robot_y + y
-            print(f"obs_x={obs_x}, obs_y={obs_y}, x={x}, y={y}")
-            if obs_x < 0 or obs_x > 9 or obs_y < 0 or obs_y > 9:
-                obs_location_onGrid = find_location_onGrid(mylocation_onMap, [obs_x,obs_y])
-                if isOutOfBounds(obs_location_onGrid[0],obs_location_onGrid[1]) == False:
-                    obs_location_onGrid_array.append(obs_location_onGrid)
-                    print(f"obs_location_onGrid will be added to obstacle array: {obs_location_onGrid}")
-                else:
-                    print(f"obs_location_onGrid will NOT be added to obstacle array: {obs_location_onGrid}")
-            else:
-                print(f"obs_x={obs_x}, obs_y={obs_y} is in the map, so it should not be considered an obstacle")
-    
-# aa the obstacles to the monte carlo grid position
-def addObstacleToMonteCarloCoordinates(mylocation_onMap, obs_onMap, obs_location_onGrid_array):
-    # the reference point is the center of the grid (2,2)
-    print(f"addObstacleToMonteCarloCoordinates - mylocation_onMap={mylocation_onMap}, obs_onMap={obs_onMap}")
-
-    obs_onGrid = find_location_onGrid(mylocation_onMap, obs_onMap)
-    print(f"addObstacleToMonteCarloCoordinates - obs_onGrid={obs_onGrid}")
-    if isOutOfBounds(obs_onGrid[0],obs_onGrid[1]):
-        print("addObstacleToMonteCarloCoordinates - the obstacle is out of the Monte Carlo grid")
-        return
-    obs_location_onGrid_array.append(obs_onGrid)
-    return
-
-# The obstacle can be in more than one space in the grid
+# The obstacle can be in more than one square of the map
 #           U
 #         L O R 
 #           D  
-def calculate_obstacle_onMap(mylocation_onMap, obstacle_pos):
-    print(f"calculate_obstacle_onMap - mylocation_onMap={mylocation_onMap}, obstacle_pos={obstacle_pos}")
-    obs_location_onGrid_array = []
-    obs_onMap, _ = find_location_onMap(obstacle_pos)
-    print(f"calculate_obstacle_onMap - obs_onMap={obs_onMap}")
-
-    addObstacleToMonteCarloCoordinates(mylocation_onMap, obs_onMap, obs_location_onGrid_array)
-
-    # Up
-    border_obs_onMap, _ = find_location_onMap([obstacle_pos[0]-constants.OBSTACLE_RAD,obstacle_pos[1]])
-    if border_obs_onMap != obs_onMap:
-        print(f"calculate_obstacle_onMap - U border_obs_onMap={border_obs_onMap}")
-        addObstacleToMonteCarloCoordinates(mylocation_onMap, border_obs_onMap, obs_location_onGrid_array)
-
-    # Down
-    border_obs_onMap, _ = find_location_onMap([obstacle_pos[0]+constants.OBSTACLE_RAD,obstacle_pos[1]])
-    if border_obs_onMap != obs_onMap:
-        print(f"calculate_obstacle_onMap - D border_obs_onMap={border_obs_onMap}")
-        addObstacleToMonteCarloCoordinates(mylocation_onMap, border_obs_onMap, obs_location_onGrid_array)
-
-    # Left 
-    border_obs_onMap, _ = find_location_onMap([obstacle_pos[0],obstacle_pos[1]-constants.OBSTACLE_RAD])
-    if border_obs_onMap != obs_onMap:
-        print(f"calculate_obstacle_onMap - L border_obs_onMap={border_obs_onMap}")
-        addObstacleToMonteCarloCoordinates(mylocation_onMap, border_obs_onMap, obs_location_onGrid_array)
-
-    # Right
-    border_obs_onMap, _ = find_location_onMap([obstacle_pos[0],obstacle_pos[1]+constants.OBSTACLE_RAD])
-    if border_obs_onMap != obs_onMap:
-        print(f"calculate_obstacle_onMap - R border_obs_onMap={border_obs_onMap}")
-        addObstacleToMonteCarloCoordinates(mylocation_onMap, border_obs_onMap, obs_location_onGrid_array)
-
-    return obs_location_onGrid_array
+# the squares of the grid around the robot (in the center) with an obstacle, read from the occupancy
+# map of the obstacle list, built once per episode (see occupancy_map.py).
+# The squares out of the map (OOB) are obstacles too
+def calculate_obstacles_onGrid(mylocation_onMap, obstacle_list):
+    occupancy = occupancy_map.map_for(obstacle_list, 1, occupancy_map.CROSS)
+    return occupancy.occupied_in(mylocation_onMap[0] - CENTER, mylocation_onMap[1] - CENTER, montecarlo.GRID_SIZE, outside=True)
+
+# all the states of the grid, the ones on its border first
+def all_grid_states():
+    border = [(0,y) for y in range(LAST + 1)] + [(x,0) for x in range(1, LAST + 1)] + [(LAST,y) for y in range(1, LAST + 1)] + [(x,LAST) for x in range(1, LAST)]
+    return border + [(x,y) for x in range(1, LAST) for y in range(1, LAST)]
+
+# the states of a side of the grid, from its middle to its ends
+def side_states(state_of):
+    return [state_of(CENTER)] + [state for d in range(1, CENTER + 1) for state in (state_of(CENTER - d), state_of(CENTER + d))]
+
+# the states of the grid along its two sides from the corner (x,y), the closest to the corner first.
+# At the same distance, the state on the same x comes first when y_first
+def corner_states(x, y, y_first):
+    dx = 1 if x == 0 else -1
+    dy = 1 if y == 0 else -1
+    states = [(x,y)]
+    for d in range(1, CENTER + 1):
+        states += [(x,y + dy * d), (x + dx * d,y)] if y_first else [(x + dx * d,y), (x,y + dy * d)]
+    return states
 
 # finds the best place for the end state
-def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
+def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos, obstacle_list):
 
     print(f"obs_location_onGrid_array={obs_location_onGrid_array}")
 
-    all_end_states = [(0,0),(0,1),(0,2),(0,3),(0,4),(1,0),(2,0),(3,0),(4,0),(4,1),(4,2),(4,3),(4,4),(1,4),(2,4),(3,4),(1,1),(1,2),(1,3),(2,1),(2,2),(2,3),(3,1),(3,2),(3,3)]    
+    all_end_states = all_grid_states()
     print(f"full all_end_states={all_end_states}")
     end_state = None
 
@@ -261,7 +212,7 @@ def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
         if end_state in obs_location_onGrid_array:
             obs_location_onGrid_array.remove(end_state)
     else:    
-        best_end_states = getBestEndState(mylocation, goal_pos)
+        best_end_states = getBestEndState(mylocation, next_waypoint(mylocation, obstacle_list, goal_pos))
         print(f"best_end_states={best_end_states}")
         for state in best_end_states:
             if state not in obs_location_onGrid_array:
@@ -282,7 +233,14 @@ def calculate_end_state_onGrid(mylocation, obs_location_onGrid_array, goal_pos):
 
     return end_state     
 
-# returns a list of the best places for the end state
+# position the local policy aims at: the next square of the global plan to the goal,
+# around the obstacles out of the local grid too (see map_planner.py), or the goal when it is closer
+def next_waypoint(mylocation, obstacle_list, goal_pos):
+    waypoint = map_planner.planner_for(obstacle_list, goal_pos).waypoint(mylocation, goal_pos)
+    print(f"next_waypoint - mylocation={mylocation}, waypoint={waypoint}")
+    return waypoint
+
+# returns a list of the best places for the end state, towards goal_pos (the goal or the next waypoint)
 def getBestEndState(mylocation, goal_pos):
     robot_onMap, _ = find_location_onMap(mylocation)
     goal_onMap, _ = find_location_onMap(goal_pos)
@@ -291,29 +249,29 @@ def getBestEndState(mylocation, goal_pos):
 
     # agent is above the target    
     if agentIsAboveGoal(robot_onMap, goal_onMap):
-        end_states = [(2,4),(1,4),(3,4),(0,4),(4,4)]
+        end_states = side_states(lambda k: (k,LAST))
     # agent is below the target    
     elif agentIsBelowGoal(robot_onMap, goal_onMap):
-        end_states = [(2,0),(1,0),(3,0),(0,0),(4,0)]
+        end_states = side_states(lambda k: (k,0))
     # agent is on the right of the target    
     elif agentIsRightOfGoal(robot_onMap, goal_onMap):
-        end_states = [(0,2),(0,1),(0,3),(0,0),(0,4)]
+        end_states = side_states(lambda k: (0,k))
     # agent is on the left of the target    
     elif agentIsLeftOfGoal(robot_onMap, goal_onMap):
-        end_states = [(4,2),(4,1),(4,3),(4,0),(4,4)]
+        end_states = side_states(lambda k: (LAST,k))
     # agent is in the bottom right of the target    
     elif agentIsBottonRightOfGoal(robot_onMap, goal_onMap):
-        end_states = [(0,0),(1,0),(0,1),(2,0),(0,2)]
+        end_states = corner_states(0, 0, False)
     # agent is in the top right of the target    
     elif agentIsTopRightOfGoal(robot_onMap, goal_onMap):
-        end_states = [(0,4),(0,3),(1,4),(0,2),(2,4)]
+        end_states = corner_states(0, LAST, True)
     # agent is in the top left of the target    
     elif agentIsTopLeftOfGoal(robot_onMap, goal_onMap):
-        end_states = [(4,4),(4,3),(3,4),(4,2),(2,4)]
+        end_states = corner_states(LAST, LAST, True)
     # agent is in the bottom left of the target    
     else:
         print(f"agent is in the bottom left of the target")
-        end_states = [(4,0),(3,0),(4,1),(2,0),(4,2)]
+        end_states = corner_states(LAST, 0, False)
 
     return end_states
 
@@ -360,55 +318,26 @@ def agentIsTopLeftOfGoal(robot_onMap, goal_onMap):
     return False
 
 
-# This function is to check if the obtacles and agent are in the 5x5
+# This function is to check if the obtacles and agent are in the grid
 def check_obstacle(pos, obs_list):
   logger.log(f"check_obstacle - pos={pos}", True)  
-  obstacles=[]
   robot_loc_onMap, _ = find_location_onMap(pos)
   logger.log(f"check_obstacle - robot_loc_onMap={robot_loc_onMap}", True)
-  for i in obs_list:
-    obs_loc_onMap, _ = find_location_onMap(i)
-    logger.log(f"check_obstacle - obs_loc_onMap={obs_loc_onMap}", True)
-
-    obs_loc_onGrid = find_location_onGrid(robot_loc_onMap, obs_loc_onMap)
-    if isOutOfBounds(obs_loc_onGrid[0],obs_loc_onGrid[1]):
-      logger.log(f"{obs_loc_onGrid} is NOT in the range of 5x5 square", True)
-    else: 
-      logger.log(f"{obs_loc_onGrid} is in the range of 5x5 square", True)
-      obstacles.append(i)
-
-    logger.log(f"check_obstacle - obstacles={obstacles}", True)
+  # the grid is made of the squares up to CENTER squares away from the robot
+  obstacles = obstacle_index.index_for(obs_list).in_cells(robot_loc_onMap, CENTER)
+  logger.log(f"check_obstacle - obstacles={obstacles}", True)
 
   return obstacles
 
 # This function is to check if the obtacles and agent are in the same 3x3
 def check_obstacle_3x3(pos, obs_list):
   logger.log(f"check_obstacle_3x3 - pos={pos}", True)  
-  obstacles=[]
   robot_loc_onMap, _ = find_location_onMap(pos)
   logger.log(f"check_obstacle_3x3 - robot_loc_onMap={robot_loc_onMap}", True)
-  for i in obs_list:
-    obs_loc_onMap, _ = find_location_onMap(i)
-    logger.log(f"check_obstacle_3x3 - obs_loc_onMap={obs_loc_onMap}", True)
-
-    obs_loc_onGrid = find_location_onGrid(robot_loc_onMap, obs_loc_onMap)
-    x = obs_loc_onGrid[0]
-    y = obs_loc_onGrid[1]
-    if x < 1 or x > 3 or y < 1 or y > 3:
-      logger.log(f"{obs_loc_onGrid} is NOT in the range of 3x3 square", True)
-    else: 
-      logger.log(f"{obs_loc_onGrid} is in the range of 3x3 square", True)
-      obstacles.append(i)
-
-    logger.log(f"check_obstacle_3x3 - obstacles={obstacles}", True)
+  obstacles = obstacle_index.index_for(obs_list).in_cells(robot_loc_onMap, 1)
+  logger.log(f"check_obstacle_3x3 - obstacles={obstacles}", True)
   return obstacles
 
-# Inverte x and y and run monte carlo
-def runMonteCarlo(end_state, obs_location_onMap_array):
-    newEndState = invertCoordinate(end_state)
-    newObs_location_onMap_array = [invertCoordinate(location) for location in obs_location_onMap_array]
-    return montecarlo.calculate_gridworld_policy(newEndState, newObs_location_onMap_array)
-
 # in the robot world x is col and y is row, but in montecarlo it is the oposite 
 def invertCoordinate(pos):
     return (pos[1],pos[0])
@@ -0,0 +1,128 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Flow field of an environment (obstacle list and goal): the heading to take in every cell of the frame.
+The frame is divided in cells of cell_size x cell_size pixels, cell (i, j) has the points with
+int(x / cell_size) = i and int(y / cell_size) = j, same order as the positions (x, y):
+- blocked: the cells whose center is in an obstacle (closer than OBSTACLE_RAD), the robot can not go through them
+- weight: cost of a move from each cell, 1 in the free cells and inflation_cost in the cells closer
+  than clearance to an obstacle, so the paths keep away from the obstacles when they can
+  (and the robot still finds a way out when it starts, or the goal is, close to an obstacle)
+- cost: cost-to-go of every cell, the cost of the cheapest path to the goal cell moving to one of the
+  8 neighbour cells (the diagonals cost sqrt(2) times more). It is calculated from the goal by relaxing
+  all the cells at once until nothing changes. inf in the blocked cells and when there is no path
+- heading: bearing in degrees (see geometry.brg_in_deg) to the neighbour cell with the lowest cost.
+  NaN in the goal cell and where there is no way to the goal: head straight to the goal
+The field is compiled once per environment, then the heading of any position is one array lookup.
+'''
+
+import math
+import numpy as np
+import constants
+import policy_cache
+
+# (di, dj) of the 8 neighbour cells and the cost of moving to them
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+STEP_COSTS = np.array([1.0] * 4 + [math.sqrt(2)] * 4)
+
+# values of the neighbour cells: shifted[k, i, j] = values[i + di, j + dj] of NEIGHBOURS[k], fill out of the frame
+def shift_neighbours(values, fill):
+    n_x, n_y = values.shape
+    padded = np.full((n_x + 2, n_y + 2), fill, dtype=values.dtype)
+    padded[1:-1, 1:-1] = values
+    return np.stack([padded[1 + di:n_x + 1 + di, 1 + dj:n_y + 1 + dj] for di, dj in NEIGHBOURS])
+
+class FlowField:
+    def __init__(self, obstacle_list, goal_pos, cell_size=None, clearance=None, inflation_cost=None, lookahead=None):
+        self.obstacle_list = obstacle_list
+        self.size = len(obstacle_list)
+        self.goal_pos = tuple(goal_pos)
+        self.cell_size = cell_size if cell_size is not None else constants.FLOW_FIELD_CELL_SIZE
+        self.clearance = clearance if clearance is not None else constants.FLOW_FIELD_CLEARANCE
+        self.inflation_cost = inflation_cost if inflation_cost is not None else constants.FLOW_FIELD_INFLATION_COST
+        self.lookahead = lookahead if lookahead is not None else constants.FLOW_FIELD_LOOKAHEAD
+        self.n_cells = int(math.ceil(constants.FRAME_SIZE / self.cell_size))
+        centers = (np.arange(self.n_cells) + 0.5) * self.cell_size
+        distance = np.full((self.n_cells, self.n_cells), np.inf) # to the nearest obstacle
+        for obs in obstacle_list:
+            distance = np.minimum(distance, np.hypot(centers[:, np.newaxis] - obs[0], centers[np.newaxis, :] - obs[1]))
+        goal = self.cell_of(goal_pos)
+        self.blocked = distance < constants.OBSTACLE_RAD
+        self.blocked[goal] = False # the goal can always be reached
+        self.weight = np.where(distance < self.clearance, float(self.inflation_cost), 1.0)
+
+        self.cost = np.full((self.n_cells, self.n_cells), np.inf)
+        self.cost[goal] = 0
+        step_costs = STEP_COSTS[:, np.newaxis, np.newaxis] * self.weight
+        while True:
+            cost = np.minimum(self.cost, (shift_neighbours(self.cost, np.inf) + step_costs).min(axis=0))
+            cost[self.blocked] = np.inf
+            cost[goal] = 0
+            if (cost == self.cost).all():
+                break
+            self.cost = cost
+
+        # the path of each cell goes to its neighbour with the lowest cost, the heading points
+        # lookahead cells ahead on the path, so a robot moving more than one cell per step follows it
+        neighbour_cost = shift_neighbours(self.cost, np.inf) + step_costs
+        best = neighbour_cost.argmin(axis=0)
+        i, j = np.indices(self.cost.shape)
+        next_i = i + np.array(NEIGHBOURS)[best, 0]
+        next_j = j + np.array(NEIGHBOURS)[best, 1]
+        next_i[goal] = goal[0] # the path ends in the goal
+        next_j[goal] = goal[1]
+        ahead_i, ahead_j = next_i, next_j
+        for k in range(self.lookahead - 1):
+            ahead_i, ahead_j = next_i[ahead_i, ahead_j], next_j[ahead_i, ahead_j]
+        self.heading = np.degrees(np.arctan2(ahead_i - i, j - ahead_j)) % 360
+        self.heading[~np.isfinite(neighbour_cost.min(axis=0))] = np.nan
+        self.heading[goal] = np.nan
+
+    # cell of a position, the positions out of the frame are in the cells on its border
+    def cell_of(self, pos):
+        i = min(max(int(pos[0] / self.cell_size), 0), self.n_cells - 1)
+        j = min(max(int(pos[1] / self.cell_size), 0), self.n_cells - 1)
+        return i, j
+
+    # heading in degrees at the position, or None to head straight to the goal
+    def heading_at(self, pos):
+        heading = self.heading[self.cell_of(pos)]
+        if np.isnan(heading):
+            return None
+        return float(heading)
+
+    # cost-to-go of the position, the length of the path to the goal in cells when it keeps away from the obstacles
+    def cost_at(self, pos):
+        return float(self.cost[self.cell_of(pos)])
+
+    # True if the field was compiled for this environment
+    def matches(self, obstacle_list, goal_pos):
+        return obstacle_list is self.obstacle_list and len(obstacle_list) == self.size and tuple(goal_pos) == self.goal_pos
+
+# fields of the environments seen so far, by obstacles and goal, so the episodes with the same environment share them
+_fields = policy_cache.LRUCache(constants.FLOW_FIELD_CACHE_SIZE)
+_last_field = None
+
+# returns the flow field of the environment. It is compiled only once per environment,
+# and again when obstacles are added to the list or the goal changes
+def field_for(obstacle_list, goal_pos):
+    global _last_field
+    if _last_field is None or not _last_field.matches(obstacle_list, goal_pos):
+        key = (tuple(tuple(obs[:2]) for obs in obstacle_list), tuple(goal_pos))
+        if key not in _fields:
+            _fields[key] = FlowField(obstacle_list, goal_pos)
+        _last_field = _fields[key]
+        # the field may have been compiled for another list with the same obstacles
+        _last_field.obstacle_list = obstacle_list
+        _last_field.size = len(obstacle_list)
+    return _last_field
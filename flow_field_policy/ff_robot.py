@@ -0,0 +1,109 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Implementing a robot that walks following the flow field of the environment (see flow_field.py).
+The flow field is compiled once for the obstacles and the goal, then at every step the heading
+is read from it for the position of the robot, no sonar and no policy lookup are needed.
+'''
+
+import sys
+sys.path.insert(0,'..')
+import constants
+import flow_field
+import obstacle_index
+import trajectory
+from geometry import brg_in_deg, angle_to_vector, create_vector
+
+class Robot:
+    def __init__(self, pos, co, n_sensor, goal_pos):
+        self.steps = 0
+        self.pos = pos
+        self.history = trajectory.Trajectory(constants.TRAJECTORY_MAX_LEN)
+        self.history.append(pos)
+        self.co = co
+        self.spd = 10 # robot speed in pixels/ step
+        self.goal_brg = brg_in_deg(self.pos, goal_pos)
+        self.obstacles_in_view = [] # the robot does not use its sensors
+        self.field = None
+
+    def get_obstacles_in_view(self):
+        return self.obstacles_in_view
+
+    def update(self, full_obstacle_list, goal_pos):
+        self.steps += 1
+        self.field = flow_field.field_for(full_obstacle_list, goal_pos)
+
+        #re-calculate direction to goal
+        self.goal_brg = brg_in_deg(self.pos, goal_pos)
+        heading = self.field.heading_at(self.pos)
+        if heading is None: # in the goal cell or there is no way around the obstacles
+            self.co = self.goal_brg
+        else:
+            self.co = heading
+
+        #move the robot by one step...
+        self.move(1)
+        return self.has_hit_obstacle(full_obstacle_list), self.has_reached_goal(goal_pos)
+
+    def has_reached_goal(self, goal_pos):
+        x = self.pos[0]
+        y = self.pos[1]
+        radius = 12.5
+        center_x = goal_pos[0]
+        center_y = goal_pos[1]
+        if (x - center_x)**2 + (y - center_y)**2 < radius**2:
+            print("WE REACHED THE GOAL! CONGRATS!!!!")
+            return True
+        return False
+
+    def has_hit_obstacle(self, full_obstacle_list):
+        if len(obstacle_index.index_for(full_obstacle_list).within(self.pos, constants.OBSTACLE_RAD)) > 0:
+            print("WE HIT THE OBSTACLE! START CRYING!!!!")
+            return True
+        return False
+
+    def move(self, dT):
+        u_vec = angle_to_vector(self.co)
+
+        self.pos[0] += self.spd * dT * u_vec[1]
+        self.pos[1] -= self.spd * dT * u_vec[0]
+
+        self.history.append(self.pos)
+
+    def get_pos(self):
+        return self.pos
+
+    def set_pos(self, pos):
+        self.pos = pos
+
+    def set_co(self, co):
+        self.co = co
+
+    def delete_history(self):
+        self.history.clear()
+
+    def draw(self, canvas):
+        #Draw the robot
+        canvas.draw_circle(self.pos, 4, 3, "yellow")
+        canvas.draw_text("R", [self.pos[0] + 10, self.pos[1] +10], 16, "yellow")
+        #Draw brg line to goal
+        self.goal_vec = create_vector(self.pos, 150, self.goal_brg)
+        canvas.draw_line(self.pos, self.goal_vec, 2, "teal")
+        #Draw current heading vector
+        self.co_vec = create_vector(self.pos, 150, self.co)
+        canvas.draw_line(self.pos, self.co_vec, 2, "white")
+        #draw history
+        for point in self.history:
+            canvas.draw_circle(point,2,2, "lime")
+
+        canvas.draw_text(f"Steps = {self.steps}", (5, 500), 12, 'White')
@@ -0,0 +1,113 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Geometry functions shared by all the robots.
+Bearings are in degrees, clockwise from the top of the screen (y grows downwards).
+The scalar functions are used for one pair of points, the *_array ones take a list
+of points and return one value per point.
+'''
+
+import math
+import numpy as np
+import constants
+
+def brg_in_deg(p0, p1):#bearing only in degrees
+    return math.degrees(math.atan2(p1[0] - p0[0], p0[1] - p1[1])) % 360
+
+def dist(p1, p0):#distance only
+    return math.hypot(p1[0] - p0[0], p1[1] - p0[1])
+
+def dist_and_brg_in_deg(p0, p1):#bearing and distance in degrees between two points
+    return dist(p0, p1), brg_in_deg(p0, p1)
+
+def relative_brg(b1, b2):
+    rb = b2 - b1
+    if rb > 180:
+        rb = 360 - rb
+    if rb < -180:
+        rb += 360
+        rb *= -1
+    return rb
+
+def angle_to_vector(ang):#resolve angles into vectors
+    ang = math.radians(ang)
+    return [math.cos(ang), math.sin(ang)]
+
+def create_vector(from_pos, length, brg):
+    u_vec = angle_to_vector(brg)
+    vec0 = from_pos[0] + length * u_vec[1]
+    vec1 = from_pos[1] - length * u_vec[0]
+    return [vec0, vec1]
+
+def rel_brg_fm_offset_sensor(true_hdg, sensor_offset, tgt_brg):
+    #given robot's true heading, the sensor offset angle and the
+    #true brg of the target, this fn will return the relative brg
+    #of the target from the sensor's line of sight
+    sensor_look_brg = (true_hdg + sensor_offset)%360
+    tgt_rel_fm_sensor = tgt_brg - sensor_look_brg
+    if tgt_rel_fm_sensor < -180:
+        tgt_rel_fm_sensor += 360
+    return tgt_rel_fm_sensor
+
+# converts a list of (x, y) positions into a (n, 2) float array
+# arrays that already have more dimensions, like (n_robots, n, 2), are kept as they are
+def as_points(points):
+    points = np.asarray(points, dtype=float)
+    if points.ndim < 2:
+        return points.reshape(-1, 2)
+    return points
+
+# p0 can also be an array of positions, e.g. (n_robots, 1, 2) against (n_robots, n, 2) points
+def dist_array(p0, points):
+    p0 = np.asarray(p0, dtype=float)
+    points = as_points(points)
+    return np.hypot(points[..., 0] - p0[..., 0], points[..., 1] - p0[..., 1])
+
+def brg_in_deg_array(p0, points):
+    p0 = np.asarray(p0, dtype=float)
+    points = as_points(points)
+    return np.degrees(np.arctan2(points[..., 0] - p0[..., 0], p0[..., 1] - points[..., 1])) % 360
+
+def dist_and_brg_in_deg_array(p0, points):
+    return dist_array(p0, points), brg_in_deg_array(p0, points)
+
+def relative_brg_array(b1, b2):
+    rb = np.asarray(b2, dtype=float) - b1
+    rb = np.where(rb > 180, 360 - rb, rb)
+    return np.where(rb < -180, -(rb + 360), rb)
+
+# the items of point_list that are closer than radius to pos, in the same order
+def points_within(pos, point_list, radius):
+    if len(point_list) == 0:
+        return []
+    inside = dist_array(pos, point_list) < radius
+    return [point for point, is_inside in zip(point_list, inside) if is_inside]
+
+# True if pos is inside the circle of radius around any of the points
+def is_inside_any(pos, point_list, radius):
+    if len(point_list) == 0:
+        return False
+    points = as_points(point_list)
+    return bool(((points[:, 0] - pos[0])**2 + (points[:, 1] - pos[1])**2 < radius**2).any())
+
+# True if none of the obstacles closer than the goal is blocking the line from pos to goal_pos
+def path_is_clear(pos, goal_pos, obstacle_list, clearance=constants.OBSTACLE_RAD + constants.ROBOT_RAD):
+    if len(obstacle_list) == 0:
+        return True
+    d_obs, obs_brg = dist_and_brg_in_deg_array(pos, obstacle_list)
+    ahead = dist(pos, goal_pos) > d_obs
+    rel_brg_radians = np.radians(np.abs(relative_brg_array(brg_in_deg(pos, goal_pos), obs_brg)))
+    #obstacles too far to the side can not be measured with asin and block the path
+    d_lateral = np.abs(d_obs * np.arcsin(np.minimum(rel_brg_radians, 1)))
+    blocked = ahead & ((rel_brg_radians > 1) | (d_lateral < clearance))
+    return not blocked.any()
@@ -0,0 +1,89 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Symmetries of the square local grids of the dynamic policies (4x4 and 5x5).
+A layout (end state and obstacles) that is rotated or mirrored has the same policy, with the
+states moved and the actions turned the same way. So the policy cache keeps one policy per
+group of equivalent layouts: the canonical layout, the one with the smallest policy key of the
+8 symmetries of the square, is solved and its policy is transformed back to the layout of the robot.
+A symmetry is (swap, flip_row, flip_col): (row, col) is first swapped to (col, row) if swap,
+then row becomes size-1-row if flip_row and col becomes size-1-col if flip_col.
+All the states are in the monte carlo coordinates (row, col).
+'''
+
+import monte_carlo_core
+import policy_solvers
+
+SYMMETRIES = tuple((swap, flip_row, flip_col) for swap in (False, True) for flip_row in (False, True) for flip_col in (False, True))
+IDENTITY = SYMMETRIES[0]
+
+SWAPPED_ACTIONS = {'U': 'L', 'D': 'R', 'L': 'U', 'R': 'D'}
+FLIPPED_ROW_ACTIONS = {'U': 'D', 'D': 'U', 'L': 'L', 'R': 'R'}
+FLIPPED_COL_ACTIONS = {'U': 'U', 'D': 'D', 'L': 'R', 'R': 'L'}
+
+def transform_state(state, symmetry, size):
+    swap, flip_row, flip_col = symmetry
+    row, col = (state[1], state[0]) if swap else (state[0], state[1])
+    if flip_row:
+        row = size - 1 - row
+    if flip_col:
+        col = size - 1 - col
+    return (row, col)
+
+def transform_action(action, symmetry):
+    swap, flip_row, flip_col = symmetry
+    if action not in SWAPPED_ACTIONS: # no action (' ')
+        return action
+    if swap:
+        action = SWAPPED_ACTIONS[action]
+    if flip_row:
+        action = FLIPPED_ROW_ACTIONS[action]
+    if flip_col:
+        action = FLIPPED_COL_ACTIONS[action]
+    return action
+
+# the flips are undone first and the swap after, which is the same as swapping first
+# and then flipping the other axes
+def inverse(symmetry):
+    swap, flip_row, flip_col = symmetry
+    if swap:
+        return (swap, flip_col, flip_row)
+    return symmetry
+
+# policy dict (row, col) -> action of the transformed layout
+def transform_policy(policy, symmetry, size):
+    if symmetry == IDENTITY:
+        return policy
+    return {transform_state(state, symmetry, size): transform_action(action, symmetry) for state, action in policy.items()}
+
+# returns the symmetry that takes the layout to its canonical layout, and the canonical end state and obstacles
+def canonical_layout(end_state, obstacle_states, size):
+    best = None
+    for symmetry in SYMMETRIES:
+        end = transform_state(end_state, symmetry, size)
+        obstacles = [transform_state(state, symmetry, size) for state in obstacle_states]
+        key = (end[0] * size + end[1], monte_carlo_core.state_mask(obstacles, size))
+        if best is None or key < best[0]:
+            best = (key, symmetry, end, obstacles)
+    return best[1], best[2], best[3]
+
+# policy of the layout, from the cache or calculated with solve(end_state, obstacle_states, solver).
+# The cache keeps the policies of the canonical layouts, with the policy_solvers.policy_key of the
+# canonical layout as key. Returns the policy and if it was in the cache
+def cached_policy(cache, solver, end_state, obstacle_states, size, solve):
+    symmetry, end, obstacles = canonical_layout(end_state, obstacle_states, size)
+    key = policy_solvers.policy_key(solver, end, obstacles, size, size)
+    cached = key in cache
+    if not cached:
+        cache[key] = solve(end, obstacles, solver)
+    return transform_policy(cache[key], inverse(symmetry), size), cached
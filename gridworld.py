@@ -0,0 +1,77 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Grid world of any size for the local grids of the dynamic policies, built from its dimensions only.
+The states are numbered row by row, state (i, j) is i * cols + j, and the grid is kept in arrays:
+- next_state: (states x actions) state reached with each action. The moves that would leave the grid
+  are not legal, they keep the agent where it is. The terminal states have no legal actions
+- reward: reward for arriving at each state, step_cost everywhere until obstacles and end states are set
+- terminal: the end states
+This is the grid used by the solvers in policy_solvers.py and monte_carlo_core.py.
+'''
+
+import numpy as np
+from monte_carlo_core import ALL_POSSIBLE_ACTIONS, MOVES
+
+class GridWorld:
+    def __init__(self, rows, cols, step_cost=-1):
+        self.rows = rows
+        self.cols = cols
+        self.n_states = rows * cols
+        row, col = np.divmod(np.arange(self.n_states), cols)
+        self.legal = np.zeros((self.n_states, len(ALL_POSSIBLE_ACTIONS)), dtype=bool)
+        self.next_state = np.empty((self.n_states, len(ALL_POSSIBLE_ACTIONS)), dtype=int)
+        for a, action in enumerate(ALL_POSSIBLE_ACTIONS):
+            next_row = row + MOVES[action][0]
+            next_col = col + MOVES[action][1]
+            self.legal[:, a] = (next_row >= 0) & (next_row < rows) & (next_col >= 0) & (next_col < cols)
+            self.next_state[:, a] = np.where(self.legal[:, a], next_row * cols + next_col, np.arange(self.n_states))
+        self.reward = np.full(self.n_states, float(step_cost))
+        self.terminal = np.zeros(self.n_states, dtype=bool)
+
+    def state_index(self, state):
+        return state[0] * self.cols + state[1]
+
+    def state(self, s):
+        return (s // self.cols, s % self.cols)
+
+    def all_states(self):
+        return [self.state(s) for s in range(self.n_states)]
+
+    # legal actions of a state, like the actions dict of the original grids
+    def actions(self, state):
+        s = self.state_index(state)
+        return tuple(action for a, action in enumerate(ALL_POSSIBLE_ACTIONS) if self.legal[s, a])
+
+    # dict (row, col) -> reward for arriving at the state
+    def rewards(self):
+        return {self.state(s): reward for s, reward in enumerate(self.reward.tolist())}
+
+    def set_rewards(self, states, reward):
+        for state in states:
+            self.reward[self.state_index(state)] = reward
+
+    # the end state has reward 0 and no actions
+    def set_end_state(self, state):
+        s = self.state_index(state)
+        self.reward[s] = 0
+        self.terminal[s] = True
+        self.legal[s] = False
+        self.next_state[s] = s
+
+# square grid with the obstacles and the end state of a dynamic policy layout, all in (row, col)
+def layout_grid(size, end_state, obstacle_states, step_cost=-1, obstacle_cost=-5):
+    grid = GridWorld(size, size, step_cost)
+    grid.set_rewards(obstacle_states, obstacle_cost)
+    grid.set_end_state(end_state)
+    return grid
@@ -0,0 +1,127 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Global planner of the dynamic policies: the path to the goal over the squares of the map
+(SMALL_GRID_SIZE x SMALL_GRID_SIZE pixels, 10x10 in the frame), around the obstacles.
+- weight: cost of entering each square, 1 plus PLANNER_OBSTACLE_COST times the part of the square
+  taken by obstacles (the occupied cells of the occupancy map with 4x4 cells per square, see occupancy_map.py),
+  so the path goes around the squares with obstacles when the way around is not much longer
+- cost: cost-to-go of every square, the cost of the cheapest path to the goal square moving to one of the
+  8 neighbour squares (the diagonals cost sqrt(2) times more), calculated with Dijkstra from the goal square
+The local policies aim at the next squares of the path (the waypoint) instead of the goal,
+so the robot does not walk into a dead end that a local grid can not see.
+The plan depends only on the obstacles and the square of the goal, it is calculated once for them.
+'''
+
+import heapq
+import math
+import numpy as np
+import constants
+import occupancy_map
+import policy_cache
+
+# (dx, dy) of the 8 neighbour squares, the straight ones first
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# square of the map of a position, the positions out of the frame are in the squares on its border
+def square_of(pos, n_squares):
+    x = min(max(int(pos[0] / constants.SMALL_GRID_SIZE), 0), n_squares - 1)
+    y = min(max(int(pos[1] / constants.SMALL_GRID_SIZE), 0), n_squares - 1)
+    return x, y
+
+# position of the center of the square
+def square_center(square):
+    return [(square[0] + 0.5) * constants.SMALL_GRID_SIZE, (square[1] + 0.5) * constants.SMALL_GRID_SIZE]
+
+class MapPlanner:
+    def __init__(self, obstacle_list, goal_square, obstacle_cost=None):
+        self.obstacle_list = obstacle_list
+        self.size = len(obstacle_list)
+        self.goal_square = tuple(goal_square)
+        self.obstacle_cost = obstacle_cost if obstacle_cost is not None else constants.PLANNER_OBSTACLE_COST
+        occupancy = occupancy_map.OccupancyMap(obstacle_list, 4, occupancy_map.STAR)
+        self.n_squares = int(occupancy.n_cells / 4)
+        occupied = occupancy.occupied[:occupancy.n_cells, :occupancy.n_cells]
+        taken = occupied.reshape(self.n_squares, 4, self.n_squares, 4).mean(axis=(1, 3))
+        self.weight = 1 + self.obstacle_cost * taken
+
+        # Dijkstra from the goal square: cost[x, y] is the cost of the path from square (x, y) to the goal
+        self.cost = np.full((self.n_squares, self.n_squares), np.inf)
+        self.cost[self.goal_square] = 0
+        queue = [(0.0, self.goal_square)]
+        while len(queue) > 0:
+            cost, square = heapq.heappop(queue)
+            if cost > self.cost[square]:
+                continue
+            for dx, dy in NEIGHBOURS:
+                x, y = square[0] + dx, square[1] + dy
+                if 0 <= x < self.n_squares and 0 <= y < self.n_squares:
+                    # moving from (x, y) to square costs the weight of square
+                    new_cost = cost + math.hypot(dx, dy) * self.weight[square]
+                    if new_cost < self.cost[x, y]:
+                        self.cost[x, y] = new_cost
+                        heapq.heappush(queue, (new_cost, (x, y)))
+
+    # next square of the path from the square, the neighbour with the lowest cost to the goal
+    def next_square(self, square):
+        square = tuple(square)
+        if square == self.goal_square:
+            return square
+        best, best_cost = square, math.inf
+        for dx, dy in NEIGHBOURS:
+            x, y = square[0] + dx, square[1] + dy
+            if 0 <= x < self.n_squares and 0 <= y < self.n_squares:
+                cost = self.cost[x, y] + math.hypot(dx, dy) * self.weight[x, y]
+                if cost < best_cost:
+                    best, best_cost = (x, y), cost
+        return best
+
+    # squares of the path from the square, up to steps squares ahead (less when it reaches the goal)
+    def path_from(self, square, steps):
+        path = []
+        square = tuple(square)
+        while len(path) < steps and square != self.goal_square:
+            square = self.next_square(square)
+            path.append(square)
+        return path
+
+    # position the robot in pos should aim at: the center of the square steps squares ahead on the path,
+    # or the goal when it is closer than that
+    def waypoint(self, pos, goal_pos, steps=1):
+        path = self.path_from(square_of(pos, self.n_squares), steps)
+        if len(path) == 0 or path[-1] == self.goal_square:
+            return goal_pos
+        return square_center(path[-1])
+
+    # True if the plan was calculated for this environment
+    def matches(self, obstacle_list, goal_square):
+        return obstacle_list is self.obstacle_list and len(obstacle_list) == self.size and tuple(goal_square) == self.goal_square
+
+# plans of the environments seen so far, by obstacles and square of the goal
+_plans = policy_cache.LRUCache(constants.PLANNER_CACHE_SIZE)
+_last_plan = None
+
+# returns the plan to the goal around the obstacles. It is calculated only once per environment,
+# and again when obstacles are added to the list or the goal moves to another square
+def planner_for(obstacle_list, goal_pos):
+    global _last_plan
+    goal_square = square_of(goal_pos, int(constants.FRAME_SIZE / constants.SMALL_GRID_SIZE))
+    if _last_plan is None or not _last_plan.matches(obstacle_list, goal_square):
+        key = (tuple(tuple(obs[:2]) for obs in obstacle_list), goal_square)
+        if key not in _plans:
+            _plans[key] = MapPlanner(obstacle_list, goal_square)
+        _last_plan = _plans[key]
+        # the plan may have been calculated for another list with the same obstacles
+        _last_plan.obstacle_list = obstacle_list
+        _last_plan.size = len(obstacle_list)
+    return _last_plan
@@ -0,0 +1,272 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Array-backed Monte Carlo on-policy control, used by the monte_carlo modules of the dynamic policies.
+The grid is a gridworld.GridWorld (next state of each state/action, reward of each state,
+terminal states), and Q, the visit counts and the policy pi are (states x actions) arrays:
+- Q is the running mean of the first-visit returns (sum of returns / visits), so no list
+  of returns is kept
+- the actions are sampled from precomputed cumulative tables of the epsilon-soft policy
+run_episodes plays one episode at a time, like the original implementation. run_batched_episodes
+plays a batch of episodes at once with NumPy state arrays and calculates all their returns together.
+The speedup of the batches is only available when batching is enabled (BATCH_SIZE > 1 in the monte_carlo
+modules), the robots default to BATCH_SIZE 1 because pi is then improved after every episode, as before.
+Batching changes the policies: pi is improved once per batch. On a 4x4 layout, a solve takes about 64ms
+with one episode per batch, 49ms with 25 and 25ms with 100, so even batched it is not a few milliseconds.
+Both can stop before the last episode (window and tolerance): when the greedy policy has not changed
+and no Q value has changed by tolerance or more for window episodes in a row.
+The states are numbered row by row: state (i, j) is i * cols + j.
+'''
+
+from bisect import bisect_right
+import numpy as np
+
+ALL_POSSIBLE_ACTIONS = ('U', 'D', 'L', 'R')
+MOVES = {'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1)}
+
+# bitmask of a list of (row, col) states, bit row * cols + col is set for each state.
+# The order of the list and repeated states do not change it
+def state_mask(states, cols):
+    mask = 0
+    for row, col in states:
+        mask |= 1 << (row * cols + col)
+    return mask
+
+# cumulative probabilities of the epsilon-soft policy: row a is the policy whose greedy action is a,
+# the last row is the initial random policy
+def cumulative_tables(eps):
+    n_actions = len(ALL_POSSIBLE_ACTIONS)
+    pi = np.full((n_actions + 1, n_actions), eps / n_actions)
+    pi[np.arange(n_actions), np.arange(n_actions)] = 1 - eps + eps / n_actions
+    pi[n_actions] = 1 / n_actions
+    cdf = pi.cumsum(axis=1)
+    cdf /= cdf[:, -1:]
+    return cdf.tolist()
+
+# plays one episode from start following pi. Returns the (state, action, return) of
+# each step, in the order they were visited, and if it was cut at max_steps
+def play_episode(grid, start, pi_row, cdf, max_steps, gamma):
+    next_state = grid.next_state
+    reward = grid.reward
+    terminal = grid.terminal
+    s = start
+    a = bisect_right(cdf[pi_row[s]], np.random.random())
+    states = [s]
+    actions = [a]
+    rewards = [0]
+    steps = 0
+    truncated = False
+    while True:
+        steps += 1
+        s = next_state[s, a]
+        r = reward[s]
+        if terminal[s]:
+            break
+        # the episode is cut after max_steps + 1 steps, like in play_episodes: the last step is
+        # kept with its reward, and no action is taken in the state it reached
+        if steps > max_steps:
+            truncated = True
+            break
+        a = bisect_right(cdf[pi_row[s]], np.random.random())
+        states.append(s)
+        actions.append(a)
+        rewards.append(r)
+    # the return of each step, working backwards from the last reward
+    returns = [0.0] * len(states)
+    G = r
+    for k in range(len(states) - 1, -1, -1):
+        returns[k] = G
+        G = rewards[k] + gamma * G
+    return states, actions, returns, truncated
+
+# True when the policy has been stable for window episodes, stable is the number of episodes
+# in a row without changes of the greedy policy and with Q changes smaller than tolerance
+def has_converged(stable, window):
+    return window is not None and stable >= window
+
+# runs the episodes and returns Q, the visit counts, the number of episodes cut at max_steps,
+# the number of episodes played (less than episodes when it converged before, see has_converged)
+# and the number of steps played in them. start can also be a list of states, then each episode
+# starts in one of them picked at random (exploring starts).
+# pi_init is the initial greedy action (index) of each state, None starts with random actions in every step.
+# With improve_all, pi is improved in every state after each episode (the unvisited ones take the first of
+# their equal actions) instead of only in the visited ones, like static_policy/master-policy.py
+def run_episodes(grid, start, episodes, max_steps, gamma, eps, q_init=-10, window=None, tolerance=0.0,
+                 pi_init=None, improve_all=False):
+    n_actions = len(ALL_POSSIBLE_ACTIONS)
+    Q = np.full((grid.n_states, n_actions), float(q_init))
+    N = np.zeros((grid.n_states, n_actions), dtype=int)
+    G_sum = np.zeros((grid.n_states, n_actions))
+    pi_row = [n_actions] * grid.n_states if pi_init is None else list(pi_init) # row of the cumulative tables used in each state
+    cdf = cumulative_tables(eps)
+    starts = [grid.state_index(state) for state in start] if isinstance(start, list) else [grid.state_index(start)]
+    n_truncated = 0
+    stable = 0
+    n_episodes = 0
+    n_steps = 0
+    while n_episodes < episodes and not has_converged(stable, window):
+        s = starts[np.random.randint(len(starts))] if len(starts) > 1 else starts[0]
+        states, actions, returns, truncated = play_episode(grid, s, pi_row, cdf, max_steps, gamma)
+        n_truncated += truncated
+        n_episodes += 1
+        n_steps += len(states)
+        stable += 1
+        seen = set()
+        for s, a, G in zip(states, actions, returns):
+            # "first-visit" MC policy evaluation
+            if (s, a) in seen:
+                continue
+            seen.add((s, a))
+            G_sum[s, a] += G
+            N[s, a] += 1
+            delta = abs(G_sum[s, a] / N[s, a] - Q[s, a])
+            Q[s, a] = G_sum[s, a] / N[s, a]
+            best = int(np.argmax(Q[s]))
+            if delta >= tolerance or best != pi_row[s]:
+                stable = 0
+            pi_row[s] = best
+        if improve_all:
+            pi_row = Q.argmax(axis=1).tolist()
+    return Q, N, n_truncated, n_episodes, n_steps
+
+# greedy policy of Q for the non-terminal states: dict (row, col) -> action
+def greedy_policy(grid, Q):
+    best = Q.argmax(axis=1)
+    policy = {}
+    for s in np.flatnonzero(~grid.terminal):
+        policy[grid.state(int(s))] = ALL_POSSIBLE_ACTIONS[best[s]]
+    return policy
+
+# plays n_episodes episodes at once, all following the same pi. Returns (n_steps, n_episodes) arrays
+# with the state, action and reward of each step (state -1 after the end of the episode), and the
+# number of episodes cut at max_steps. Like play_episode, the episodes are cut after max_steps + 1 steps,
+# the last step of a cut episode is kept with its reward
+def play_episodes(grid, start, pi_row, cdf, n_episodes, max_steps):
+    n_actions = cdf.shape[1]
+    max_len = max_steps + 1
+    # the episodes are stepped with the index of the (state, action) pair, s * n_actions + a.
+    # The cumulative tables of all the states are put one after the other, the one of state s
+    # shifted by s * n_actions, so one searchsorted of s * n_actions + u finds the (state, action)
+    # pair of every episode (same as bisect_right on the table of the state)
+    flat_cdf = (np.arange(grid.n_states)[:, np.newaxis] * n_actions + cdf[pi_row]).ravel()
+    next_first_pair = grid.next_state.ravel() * n_actions # first pair of the next state
+    terminal = grid.terminal.repeat(n_actions)
+    pairs = np.empty((max_len, n_episodes), dtype=int)
+    first_pair = np.full(n_episodes, start * n_actions)
+    n_steps = 0
+    # the terminal states have no legal actions, so the finished episodes stay where they are
+    # and all of them can be stepped together until the last one finishes
+    while n_steps < max_len:
+        pair = flat_cdf.searchsorted(first_pair + np.random.random(n_episodes), 'right')
+        pairs[n_steps] = pair
+        first_pair = next_first_pair[pair]
+        n_steps += 1
+        if terminal[first_pair].all():
+            break
+    pairs = pairs[:n_steps]
+    states = pairs // n_actions
+    actions = pairs % n_actions
+    rewards = grid.reward[grid.next_state[states, actions]]
+    over = grid.terminal[states]
+    states[over] = -1
+    rewards[over] = 0
+    return states, actions, rewards, int((~terminal[first_pair]).sum())
+
+# discounted return of every step of every episode: G[t] = rewards[t] + gamma * G[t+1]
+def discounted_returns(rewards, gamma):
+    G = rewards.copy()
+    for t in range(len(G) - 2, -1, -1):
+        G[t] += gamma * G[t + 1]
+    return G
+
+# same as run_episodes, but batch_size episodes are played at once with the same pi,
+# and pi is improved after each batch instead of after each episode. For window and tolerance,
+# all the episodes of a batch have the changes of Q and pi of the batch
+def run_batched_episodes(grid, start, episodes, max_steps, gamma, eps, batch_size, q_init=-10, window=None, tolerance=0.0):
+    n_actions = len(ALL_POSSIBLE_ACTIONS)
+    n_pairs = grid.n_states * n_actions
+    Q = np.full((grid.n_states, n_actions), float(q_init))
+    N = np.zeros(n_pairs, dtype=int)
+    G_sum = np.zeros(n_pairs)
+    pi_row = np.full(grid.n_states, n_actions) # row of the cumulative tables used in each state
+    cdf = np.array(cumulative_tables(eps))
+    start = grid.state_index(start)
+    n_truncated = 0
+    stable = 0
+    n_played = 0
+    n_steps = 0
+    while n_played < episodes and not has_converged(stable, window):
+        n_episodes = min(batch_size, episodes - n_played)
+        states, actions, rewards, truncated = play_episodes(grid, start, pi_row, cdf, n_episodes, max_steps)
+        n_truncated += truncated
+        n_played += n_episodes
+        G = discounted_returns(rewards, gamma)
+
+        # "first-visit" MC policy evaluation: first step of each (state, action) in each episode.
+        # Transposed so the steps of each episode are together and in order
+        visited = (states >= 0).T
+        n_steps += int(visited.sum())
+        pairs = (states * n_actions + actions).T
+        keys = (np.arange(n_episodes)[:, np.newaxis] * n_pairs + pairs)[visited]
+        _, first = np.unique(keys, return_index=True)
+        first_pairs = keys[first] % n_pairs
+        G_sum += np.bincount(first_pairs, weights=G.T[visited][first], minlength=n_pairs)
+        N += np.bincount(first_pairs, minlength=n_pairs)
+
+        seen = N > 0
+        new_Q = G_sum[seen] / N[seen]
+        delta = np.abs(new_Q - Q.flat[seen]).max(initial=0.0)
+        Q.flat[seen] = new_Q
+        new_pi_row = np.where(seen.reshape(Q.shape).any(axis=1), Q.argmax(axis=1), n_actions)
+        if delta >= tolerance or (new_pi_row != pi_row).any():
+            stable = 0
+        else:
+            stable += n_episodes
+        pi_row = new_pi_row
+    return Q, N.reshape(Q.shape), n_truncated, n_played, n_steps
+
+# prints the Q table of the grid, every action of each state (0 in the terminal states)
+def print_Q(Q, grid):
+    print('----------------------------------------------')
+    print('| State  | U      | D      | L      | R      |')
+    print('----------------------------------------------')
+    for s in range(grid.n_states):
+        print("| {} |".format(grid.state(s)), end="")
+        if not grid.terminal[s]:
+            for a in range(len(ALL_POSSIBLE_ACTIONS)):
+                print(' {:>6.2f} |'.format(Q[s, a]), end="")
+        else:
+            print('   0.00 |   0.00 |   0.00 |   0.00 |', end="")
+        print('')
+    print('----------------------------------------------')
+
+# prints a dict (row, col) -> value over the rows x cols of the grid
+def print_values(V, g):
+    for i in range(g.rows):
+        print("---------------------------")
+        for j in range(g.cols):
+            v = V.get((i,j), 0)
+            if v >= 0:
+                print(" %.2f|" % v, end="")
+            else:
+                print("%.2f|" % v, end="") # -ve sign takes up an extra space
+        print("")
+
+# prints a policy, dict (row, col) -> action, over the rows x cols of the grid
+def print_policy(P, g):
+    for i in range(g.rows):
+        print("---------------------------")
+        for j in range(g.cols):
+            a = P.get((i,j), ' ')
+            print("  %s  |" % a, end="")
+        print("")
@@ -23,69 +23,12 @@ import random
 import sys
 sys.path.insert(0,'..')
 import constants
+import sonar_engine
+import geometry
+import obstacle_index
+import trajectory
+from geometry import brg_in_deg, dist, relative_brg, angle_to_vector, create_vector, dist_and_brg_in_deg, rel_brg_fm_offset_sensor
 
-def rel_brg_fm_offset_sensor(true_hdg, sensor_offset, tgt_brg):
-    #given robot's true heading, the sensor offset angle and the
-    #true brg of the target, this fn will return the relative brg
-    #of the target from the sensor's line of sight
-    
-    sensor_look_brg = (true_hdg + sensor_offset)%360
-    tgt_rel_fm_sensor = tgt_brg - sensor_look_brg
-
-    if tgt_rel_fm_sensor < -180:
-        tgt_rel_fm_sensor += 360
-    
-    return tgt_rel_fm_sensor
-
-def brg_in_deg(p0, p1):#bearing only in degrees
-    [x1, y1] = p0
-    [x2, y2] = p1
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return b
-
-def dist(p1, p0):#distance only
-    print(f"dist - p1={p1}, p0={p0}")
-    return math.sqrt((p1[0] - p0[0])**2+(p1[1]-p0[1])**2)
-
-def dist_and_brg_in_deg(p0, p1):#bearing and distance in degrees between two points
-    [x1, y1] = p0
-    [x2, y2] = p1
-    r = math.sqrt((x1 - x2)**2 + (y1 - y2)**2) # distance
-    a = math.degrees(math.atan((y1 - y2)/(x1 - x2 + 0.000000001)))
-    #find and correct the quadrant...
-    if  x2 >= x1:
-        b = 90 + a
-    else:
-        b = 270 + a
-    return r, b
-
-def angle_to_vector(ang):#resolve angles into vectors
-    ang = math.radians(ang)
-    return [math.cos(ang), math.sin(ang)]
-
-def relative_brg(b1, b2):
-    rb = b2 - b1
-    if rb > 180:
-        rb = 360 - rb
-    if rb < -180:
-        rb += 360
-        rb *= -1
-    return rb
-
-def create_vector(from_pos, length, brg):       
-        u_vec = angle_to_vector(brg)
-        #print "generating target line..."
-        vec0 = from_pos[0] + length * u_vec[1] 
-        vec1 = from_pos[1] - length * u_vec[0]
-        
-        return [vec0, vec1]
-
-    
 #define classes
 
 class Sonar:
@@ -96,7 +39,7 @@ class Sonar:
         self.max_r = max_r
         self.offset =  index * FOV #+ FOV/2 # on what relative bearing is this sensor looking?
         self.look_brg = (robot_co + self.offset)%360
-        self.vec = [0,0] # just a vector for grpahical ouptut of pings
+        self.output = constants.SENSOR_MAX_R
         self.has_valid_echo = False #indicates if this sonar has a "valid" obstacle in sight
         #print "Creating Sonar:" , index, " offset ", self.offset, "true LOS:", self.look_brg
             
@@ -161,9 +104,21 @@ class Sonar:
         
         self.ping_simulated(obstacle_list, platform_co)
         
-        self.vec = create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)#calculate distance vector for drawing on canvas
-        
         #print "sensor index:", self.index, " look brg:", self.look_brg
+    def set_output(self, platform_pos, platform_co, output, has_valid_echo):
+        #store the output calculated for this sensor by the batched sonar engine
+        self.set_pose(platform_pos, platform_co)
+        self.output = output
+        self.has_valid_echo = has_valid_echo
+
+    def set_pose(self, platform_pos, platform_co):
+        self.pos = platform_pos
+        self.look_brg = (platform_co + self.offset)%360
+
+    @property
+    def vec(self): # just a vector for grpahical ouptut of pings, only calculated when the sonar is drawn
+        return create_vector(self.pos, self.output + constants.ROBOT_RAD, self.look_brg)
+
     def draw(self, canvas): # draw the sensor's output
         #if self.has_valid_echo:
         canvas.draw_line(self.pos,self.vec, 1, 'lime')
@@ -171,7 +126,7 @@ class Sonar:
         #print self.index, " VE:" , self.has_valid_echo
         
 class Sonar_Array:
-    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co):
+    def __init__(self, n_sensor, SENSOR_FOV, SENSOR_MAX_R, robot_co, model=None):
         self.sonar_list = []
         self.need_diversion_flag = False
         self.n_sensor = n_sensor
@@ -184,11 +139,23 @@ class Sonar_Array:
         
         for i in i_pos:#create a list of individual sonars...
             self.sonar_list.append(Sonar(i, SENSOR_FOV, SENSOR_MAX_R, robot_co))
+        self.max_r = SENSOR_MAX_R
+        self.offsets = [s.offset for s in self.sonar_list]
+        self.model = model or constants.SONAR_MODEL # see sonar_engine.py
+        self.view_r = sonar_engine.view_radius(self.model) # obstacles closer than this can be seen
+        self.ping_cache = sonar_engine.PingCache()
+        self.pos = [0,0]
+        self.co = robot_co
    
     def update(self, robot_pos, robot_co, obstacle_list, method):
-        #update sonar array
-        for sonar in self.sonar_list:#update output of each sensor
-            sonar.update(robot_pos, robot_co, obstacle_list)
+        self.pos = robot_pos
+        self.co = robot_co
+        #update sonar array, all the sensors against all the obstacles in one batched pass
+        #skipped if the outputs are still the same (e.g. no obstacles in view)
+        if self.ping_cache.is_stale(robot_pos, robot_co, obstacle_list):
+            outputs, echoes = sonar_engine.ping(robot_pos, robot_co, self.offsets, obstacle_list, self.max_r, self.model)
+            for sonar, output, echo in zip(self.sonar_list, outputs, echoes):#update output of each sensor
+                sonar.set_output(robot_pos, robot_co, float(output), bool(echo))
             
         if method == "w_sum":#process data by method of weighted sums
             return 0
@@ -196,16 +163,18 @@ class Sonar_Array:
        
     def draw(self, canvas):
         for sonar in self.sonar_list:
+            sonar.set_pose(self.pos, self.co)#the sensors are not updated when the ping is skipped
             sonar.draw(canvas)
 
 class Robot:
-    def __init__(self, pos, co, n_sensor, goal_pos):
+    def __init__(self, pos, co, n_sensor, goal_pos, sonar_model=None):
         self.steps = 0
         self.pos = pos
-        self.history = [pos]
+        self.history = trajectory.Trajectory(constants.TRAJECTORY_MAX_LEN)
+        self.history.append(pos)
         self.co = co
         self.spd = 10 # robot speed in pixels/ step
-        self.s_array = Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co)
+        self.s_array = Sonar_Array(n_sensor, constants.SENSOR_FOV, constants.SENSOR_MAX_R, self.co, sonar_model)
         self.goal_brg = brg_in_deg(self.pos, goal_pos)
         self.obstacles_in_view = []
         self.goal_pos = goal_pos
@@ -228,20 +197,7 @@ class Robot:
 
 
     def path_is_clear(self, goal_pos):#return True if there is a clear path to the goal
-        goal_brg = brg_in_deg(self.pos, goal_pos)
-        for obs in self.obstacles_in_view:
-            if dist(self.pos, goal_pos) > dist(self.pos, obs):
-                d_obs, obs_brg = dist_and_brg_in_deg(self.pos, obs)
-                rel_brg = abs(relative_brg(goal_brg, obs_brg))
-                rel_brg_radians = math.radians(rel_brg)
-                print(f"rel_brg_radians={rel_brg_radians}")
-                if rel_brg_radians < -1 or rel_brg_radians > 1:
-                    print(f"invalid rel_brg_radians={rel_brg_radians}")
-                    return False
-                d_lateral = abs(d_obs * math.asin(rel_brg_radians))
-                if d_lateral < constants.OBSTACLE_RAD + constants.ROBOT_RAD: 
-                    return False
-        return True
+        return geometry.path_is_clear(self.pos, goal_pos, self.obstacles_in_view)
 
     def has_reached_goal(self, goal_pos):
         #print(f"self.pos={self.pos}, goal_pos={goal_pos}")
@@ -258,17 +214,9 @@ class Robot:
     
     def has_hit_obstacle(self, full_obstacle_list):
         #print(f"self.pos={self.pos}, full_obstacle_list={full_obstacle_list}")
-        x = self.pos[0]
-        y = self.pos[1]
-        radius = 12.5
-
-        for obstacle_pos in full_obstacle_list:
-            center_x = obstacle_pos[0]
-            center_y = obstacle_pos[1]
-            #print(f"x={x}, y={y}, center_x={center_x}, center_y={center_y}")
-            if (x - center_x)**2 + (y - center_y)**2 < radius**2:
-                print("WE HIT THE OBSTACLE! START CRYING!!!!")
-                return True
+        if len(obstacle_index.index_for(full_obstacle_list).within(self.pos, constants.OBSTACLE_RAD)) > 0:
+            print("WE HIT THE OBSTACLE! START CRYING!!!!")
+            return True
         return False
     
     def move(self, dT):
@@ -281,7 +229,7 @@ class Robot:
 
         print(f"move - self.spd={self.spd}, self.pos={self.pos}")
         
-        self.history.append([self.pos[0], self.pos[1]])
+        self.history.append(self.pos)
         
     def get_pos(self):
         return self.pos
@@ -294,7 +242,7 @@ class Robot:
         #print "setting robot co:", self.co
     
     def delete_history(self):
-        self.history = []
+        self.history.clear()
 
     def draw(self, canvas):
         #Draw the robot
@@ -0,0 +1,67 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Spatial index of the obstacles.
+The obstacles are put in buckets of SMALL_GRID_SIZE x SMALL_GRID_SIZE pixels (the squares of the map),
+so the queries only look at the obstacles in the squares around the robot instead of the full list.
+'''
+
+import constants
+import geometry
+
+class ObstacleIndex:
+    def __init__(self, obstacle_list, cell_size=constants.SMALL_GRID_SIZE):
+        self.obstacle_list = obstacle_list
+        self.size = len(obstacle_list)
+        self.cell_size = cell_size
+        self.buckets = {} # map square -> indexes of the obstacles in it
+        for i, obs in enumerate(obstacle_list):
+            self.buckets.setdefault(self.cell_of(obs), []).append(i)
+
+    # map square of a position, same as find_location_onMap
+    def cell_of(self, pos):
+        return (int(pos[0] / self.cell_size), int(pos[1] / self.cell_size))
+
+    # True if the index was built for this list and it has not changed size since then
+    def matches(self, obstacle_list):
+        return obstacle_list is self.obstacle_list and len(obstacle_list) == self.size
+
+    # obstacles in the squares from (x0, y0) to (x1, y1), in the same order of the obstacle list
+    def _in_cell_range(self, x0, y0, x1, y1):
+        indexes = []
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                indexes.extend(self.buckets.get((x, y), ()))
+        indexes.sort()
+        return [self.obstacle_list[i] for i in indexes]
+
+    # obstacles whose square is at most reach squares away from cell
+    # reach=0 is the same square, reach=1 is the 3x3 squares around it, reach=2 the 5x5 ones
+    def in_cells(self, cell, reach=1):
+        return self._in_cell_range(cell[0] - reach, cell[1] - reach, cell[0] + reach, cell[1] + reach)
+
+    # obstacles closer than radius to pos
+    def within(self, pos, radius):
+        x0, y0 = self.cell_of((pos[0] - radius, pos[1] - radius))
+        x1, y1 = self.cell_of((pos[0] + radius, pos[1] + radius))
+        return geometry.points_within(pos, self._in_cell_range(x0, y0, x1, y1), radius)
+
+_last_index = None
+
+# returns the index of the obstacle list. It is built only once per list (episode)
+# and rebuilt when obstacles are added to it
+def index_for(obstacle_list):
+    global _last_index
+    if _last_index is None or not _last_index.matches(obstacle_list):
+        _last_index = ObstacleIndex(obstacle_list)
+    return _last_index
@@ -0,0 +1,83 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Occupancy bitmap of the obstacles of an episode, used to build the local grids of the dynamic policies.
+The map is divided in cells: the squares of the map (SMALL_GRID_SIZE x SMALL_GRID_SIZE pixels),
+each one divided in subdivisions x subdivisions cells. A cell is occupied when the center of an obstacle
+or one of its probes (points at OBSTACLE_RAD from the center, see CROSS and STAR) is in it, the same
+footprint the robots used to calculate for every obstacle at every step.
+The bitmap is built once per obstacle list (episode), and the local grid around the robot is a slice of it:
+    occupied[x, y] = True if cell (x, y) has an obstacle
+The cell of a point is calculated like find_location_onMap: square * subdivisions + cell in the square.
+'''
+
+import numpy as np
+import constants
+
+# probes of the footprint of an obstacle, in obstacle radiuses from its center
+CROSS = ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)) # center, up, down, left and right
+STAR = CROSS + ((-1, -1), (-1, 1), (1, -1), (1, 1)) # ... and the diagonals
+
+class OccupancyMap:
+    def __init__(self, obstacle_list, subdivisions=1, probes=CROSS, radius=constants.OBSTACLE_RAD):
+        self.obstacle_list = obstacle_list
+        self.size = len(obstacle_list)
+        self.subdivisions = subdivisions
+        self.probes = probes
+        self.n_cells = int(constants.FRAME_SIZE / constants.SMALL_GRID_SIZE) * subdivisions # cells of the map
+        # the bitmap has one more square after the last one, where the probes of the obstacles on the border can be
+        n_bitmap_cells = self.n_cells + subdivisions
+        self.occupied = np.zeros((n_bitmap_cells, n_bitmap_cells), dtype=bool)
+        if self.size > 0:
+            points = np.array(obstacle_list, dtype=float)[:, np.newaxis, :2] + radius * np.array(probes, dtype=float)
+            cells = self.cells_of(points.reshape(-1, 2))
+            inside = ((cells >= 0) & (cells < n_bitmap_cells)).all(axis=1)
+            self.occupied[cells[inside, 0], cells[inside, 1]] = True
+
+    # (x, y) cell of each point, same as find_location_onMap
+    def cells_of(self, points):
+        square = np.trunc(points / constants.SMALL_GRID_SIZE).astype(int)
+        in_square = (np.mod(points, constants.SMALL_GRID_SIZE) / (constants.SMALL_GRID_SIZE / self.subdivisions)).astype(int)
+        return square * self.subdivisions + in_square
+
+    # True if the map was built for this list and it has not changed size since then
+    def matches(self, obstacle_list):
+        return obstacle_list is self.obstacle_list and len(obstacle_list) == self.size
+
+    # size x size cells from cell (x0, y0): window[i, j] is cell (x0 + i, y0 + j).
+    # With outside=True the cells out of the map are obstacles too
+    def window(self, x0, y0, size, outside=False):
+        window = np.zeros((size, size), dtype=bool)
+        x1 = min(x0 + size, len(self.occupied))
+        y1 = min(y0 + size, len(self.occupied))
+        if max(x0, 0) < x1 and max(y0, 0) < y1:
+            window[max(x0, 0) - x0:x1 - x0, max(y0, 0) - y0:y1 - y0] = self.occupied[max(x0, 0):x1, max(y0, 0):y1]
+        if outside:
+            x = np.arange(x0, x0 + size)
+            y = np.arange(y0, y0 + size)
+            window |= ((x < 0) | (x >= self.n_cells))[:, np.newaxis] | ((y < 0) | (y >= self.n_cells))[np.newaxis, :]
+        return window
+
+    # occupied (x, y) cells of the window, in order
+    def occupied_in(self, x0, y0, size, outside=False):
+        return [(int(x), int(y)) for x, y in np.argwhere(self.window(x0, y0, size, outside))]
+
+_last_maps = {} # (subdivisions, probes) -> last map built
+
+# returns the occupancy map of the obstacle list. It is built only once per list (episode)
+# and rebuilt when obstacles are added to it
+def map_for(obstacle_list, subdivisions=1, probes=CROSS):
+    last_map = _last_maps.get((subdivisions, probes))
+    if last_map is None or not last_map.matches(obstacle_list):
+        last_map = _last_maps[(subdivisions, probes)] = OccupancyMap(obstacle_list, subdivisions, probes)
+    return last_map
@@ -0,0 +1,96 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Policy atlas: the policy of every possible layout of a small grid, calculated offline.
+For each end state and each obstacle bitmask (bit s set = obstacle in state s) it keeps the action
+of every state, so the atlas is a (n_states, 2^n_states, n_states) uint8 array:
+    atlas[end_state, obstacle_mask, state] = index of the action in ALL_POSSIBLE_ACTIONS
+The terminal state has NO_ACTION. The layouts are solved by value iteration (see policy_solvers.py),
+all the obstacle masks of one end state at once, and the end states in parallel.
+At runtime the atlas file is memory-mapped, so a policy lookup is one array index.
+The robot reads the action of the canonical layout (see grid_symmetry.py) and transforms it back, like the
+policies of the other solvers, so the actions are the same as the value_iteration solver, ties included.
+The states are numbered row by row in the monte carlo coordinates (row, col): state = row * cols + col.
+'''
+
+import multiprocessing
+from functools import partial
+import numpy as np
+import grid_symmetry
+import monte_carlo_core
+
+NO_ACTION = 255
+
+# actions of every state for every obstacle mask, with end_state as terminal state
+def solve_end_state(end_state, next_state, gamma, step_cost, obstacle_cost, theta=1e-12, max_iterations=10000):
+    n_states = len(next_state)
+    masks = np.arange(2 ** n_states)
+    obstacle = (masks[:, np.newaxis] >> np.arange(n_states)) & 1 == 1
+    reward = np.where(obstacle, float(obstacle_cost), float(step_cost))
+    reward[:, end_state] = 0
+    terminal = np.zeros(n_states, dtype=bool)
+    terminal[end_state] = True
+    next_state = next_state.copy()
+    next_state[end_state] = end_state # no actions in the terminal state
+
+    # value iteration for all the masks at once, same as policy_solvers.value_iteration
+    V = np.zeros((len(masks), n_states))
+    for i in range(max_iterations):
+        Q = reward[:, next_state] + gamma * V[:, next_state]
+        new_V = np.where(terminal, 0, Q.max(axis=2))
+        delta = np.abs(new_V - V).max()
+        V = new_V
+        if delta < theta:
+            break
+    Q = reward[:, next_state] + gamma * V[:, next_state]
+    actions = Q.argmax(axis=2).astype(np.uint8)
+    actions[:, end_state] = NO_ACTION
+    return actions
+
+# solves all the layouts of the grid. next_state is the (n_states, n_actions) table of the grid
+# without end state (see gridworld.GridWorld)
+def build(next_state, gamma, step_cost=-1, obstacle_cost=-5, processes=None):
+    n_states = len(next_state)
+    solve = partial(solve_end_state, next_state=next_state, gamma=gamma, step_cost=step_cost, obstacle_cost=obstacle_cost)
+    with multiprocessing.Pool(processes) as pool:
+        return np.stack(pool.map(solve, range(n_states)))
+
+# file_name is the full path of the atlas, the robot keeps it in its folder (see dynamic_policy/utils.py)
+def save(atlas, file_name):
+    np.save(file_name, atlas)
+
+_atlases = {} # file name -> memory-mapped atlas
+
+def load(file_name):
+    if file_name not in _atlases:
+        try:
+            _atlases[file_name] = np.load(file_name, mmap_mode='r')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"policy atlas {file_name} not found, run build_policy_atlas.py to create it")
+    return _atlases[file_name]
+
+# action of state for the given end state and obstacles, all in (row, col), or ' ' if there is none
+def lookup(atlas, end_state, obstacle_states, state, cols):
+    action = atlas[end_state[0] * cols + end_state[1], monte_carlo_core.state_mask(obstacle_states, cols), state[0] * cols + state[1]]
+    if action == NO_ACTION:
+        return ' '
+    return monte_carlo_core.ALL_POSSIBLE_ACTIONS[action]
+
+# action of state read from the canonical layout of the end state and obstacles (see grid_symmetry.py)
+# and transformed back to the layout of the robot, or ' ' if there is none
+def canonical_lookup(atlas, end_state, obstacle_states, state, size):
+    symmetry, end, obstacles = grid_symmetry.canonical_layout(end_state, obstacle_states, size)
+    action = lookup(atlas, end, obstacles, grid_symmetry.transform_state(state, symmetry, size), size)
+    if action == ' ':
+        return action
+    return grid_symmetry.transform_action(action, grid_symmetry.inverse(symmetry))
@@ -0,0 +1,86 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Bounded in-memory cache of the dynamic policies, used like the master_policy dict.
+It keeps at most max_entries entries and max_bytes bytes (None = no limit). When it is full,
+the least recently used entries are removed, so the policies the robot keeps going back to stay.
+The size of an entry is the size of its key and value with everything they contain
+(sys.getsizeof), an estimate: an object shared by several entries is counted in each of them.
+size, evictions and bytes_used tell how it is doing.
+'''
+
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+# size in bytes of obj and the dicts, lists, tuples and sets in it
+def deep_size(obj):
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key) + deep_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item) for item in obj)
+    return size
+
+class LRUCache(MutableMapping):
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # key -> (value, size in bytes), least recently used first
+        self.bytes_used = 0
+        self.evictions = 0
+
+    @property
+    def size(self):
+        return len(self.entries)
+
+    def __getitem__(self, key):
+        value, _ = self.entries[key]
+        self.entries.move_to_end(key)
+        return value
+
+    # membership does not change the order, the entry is used when it is read
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __setitem__(self, key, value):
+        if key in self.entries:
+            self.bytes_used -= self.entries.pop(key)[1]
+        n_bytes = deep_size(key) + deep_size(value)
+        self.entries[key] = (value, n_bytes)
+        self.bytes_used += n_bytes
+        # the entry just added is always kept, even if it is bigger than max_bytes
+        while len(self.entries) > 1 and self.is_full():
+            _, (_, n_bytes) = self.entries.popitem(last=False)
+            self.bytes_used -= n_bytes
+            self.evictions += 1
+
+    def is_full(self):
+        return ((self.max_entries is not None and len(self.entries) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes_used > self.max_bytes))
+
+    def __delitem__(self, key):
+        self.bytes_used -= self.entries.pop(key)[1]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def __repr__(self):
+        return f"LRUCache(size={self.size}, bytes_used={self.bytes_used}, evictions={self.evictions})"
@@ -0,0 +1,134 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Background solving of the policies the robot is expected to need next.
+prefetch_next() predicts the squares of the map the robot will probably enter (see predict_next_squares),
+the robot code gives the layout of their local grids (see prefetch_layout in the utils modules), and
+prefetch() solves them in a pool of worker processes while the robot keeps moving.
+collect() puts the finished policies in the cache, and solve() is used instead of the solver by
+grid_symmetry.cached_policy: a layout that is being solved in the background is waited for
+instead of being solved again.
+The layouts are the canonical ones of grid_symmetry.py, in the monte carlo coordinates (row, col).
+With 0 processes (the default, see constants.PREFETCH_PROCESSES) nothing is solved in the background and
+solve() just calls the solver. The workers reseed their random state, so the Monte Carlo policies solved
+in the background are not reproducible from run to run.
+The pool is stopped with close() or terminate() at the end of the run.
+'''
+
+import contextlib
+import io
+import multiprocessing
+import os
+import numpy as np
+import constants
+import grid_symmetry
+import map_planner
+import policy_solvers
+from geometry import create_vector
+
+PENDING_PER_PROCESS = 4 # layouts waiting or being solved per worker, the other predictions are dropped
+# solvers whose policies are not solved in the background: the atlas is only looked up, and value iteration
+# solves a layout faster than sending it to a worker and back
+NOT_PREFETCHED = (policy_solvers.ATLAS, policy_solvers.VALUE_ITERATION)
+
+# squares of the map the robot in mylocation with course co is expected to enter next:
+# the one ahead of it and the next 2 of the global plan to the goal (see map_planner.py)
+def predict_next_squares(mylocation, co, full_obstacle_list, goal_pos):
+    mylocation_onMap = [int(mylocation[0] / constants.SMALL_GRID_SIZE), int(mylocation[1] / constants.SMALL_GRID_SIZE)]
+    ahead = create_vector(mylocation, constants.SMALL_GRID_SIZE, co)
+    squares = [[int(ahead[0] / constants.SMALL_GRID_SIZE), int(ahead[1] / constants.SMALL_GRID_SIZE)]]
+    for square in map_planner.planner_for(full_obstacle_list, goal_pos).path_from(mylocation_onMap, 2):
+        squares.append(list(square))
+    n_squares = int(constants.FRAME_SIZE / constants.SMALL_GRID_SIZE)
+    return [square for i, square in enumerate(squares)
+            if square != mylocation_onMap and square not in squares[:i]
+            and 0 <= square[0] < n_squares and 0 <= square[1] < n_squares]
+
+# runs in the worker processes, the solvers print the grids and the policies
+def solve_quietly(solve, end_state, obstacle_states, solver):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solve(end_state, obstacle_states, solver)
+
+class PolicyPrefetcher:
+    # solve(end_state, obstacle_states, solver) calculates the policy of a layout of the size x size grid.
+    # processes=None uses one less than the number of CPUs, so the robot keeps one
+    def __init__(self, size, solve, processes=None):
+        self.size = size
+        self.solve_layout = solve
+        self.processes = max((os.cpu_count() or 1) - 1, 0) if processes is None else processes
+        self.pool = None # started on the first prefetch
+        self.pending = {} # policy key -> result of the worker
+        self.n_prefetched = 0
+        self.n_waited = 0 # policies the robot needed before their background solve finished
+
+    def key(self, solver, end_state, obstacle_states):
+        return policy_solvers.policy_key(solver, end_state, obstacle_states, self.size, self.size)
+
+    # starts solving the layout in the background, unless it is in the cache or already being solved
+    def prefetch(self, cache, solver, end_state, obstacle_states):
+        if self.processes == 0 or len(self.pending) >= PENDING_PER_PROCESS * self.processes:
+            return
+        _, end, obstacles = grid_symmetry.canonical_layout(end_state, obstacle_states, self.size)
+        key = self.key(solver, end, obstacles)
+        if key in self.pending or key in cache:
+            return
+        if self.pool is None:
+            # the workers are forked with the same random state, each one needs its own
+            self.pool = multiprocessing.Pool(self.processes, initializer=np.random.seed)
+        self.pending[key] = self.pool.apply_async(solve_quietly, (self.solve_layout, end, obstacles, solver))
+        self.n_prefetched += 1
+
+    # starts solving in the background the layouts of the local grids of the squares the robot is expected
+    # to enter next, so they are ready when the robot needs them. local_layout(square) returns the end state
+    # and the obstacle states of the grid of the square in the robot coordinates (x, y), or None to skip it
+    def prefetch_next(self, cache, solver, mylocation, co, full_obstacle_list, goal_pos, local_layout):
+        if self.processes == 0 or solver in NOT_PREFETCHED:
+            return
+        self.collect(cache)
+        for square in predict_next_squares(mylocation, co, full_obstacle_list, goal_pos):
+            layout = local_layout(square)
+            if layout is not None:
+                end_state, obstacle_states = layout
+                # in the robot world x is col and y is row, the layouts are (row, col)
+                self.prefetch(cache, solver, (end_state[1], end_state[0]), [(state[1], state[0]) for state in obstacle_states])
+
+    # puts the policies solved in the background in the cache
+    def collect(self, cache):
+        for key, result in list(self.pending.items()):
+            if result.ready():
+                del self.pending[key]
+                cache[key] = result.get()
+
+    # waits for the layouts being solved, puts them in the cache and stops the workers
+    def close(self, cache):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.collect(cache)
+
+    # stops the workers, the layouts being solved are dropped
+    def terminate(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        self.pending.clear()
+
+    # policy of a canonical layout: from its background solve if there is one, or solved now
+    def solve(self, end_state, obstacle_states, solver):
+        key = self.key(solver, end_state, obstacle_states)
+        if key in self.pending:
+            self.n_waited += 1
+            return self.pending.pop(key).get()
+        return self.solve_layout(end_state, obstacle_states, solver)
@@ -0,0 +1,107 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Solvers that calculate the Q table of the local grids of the dynamic policies.
+- MONTE_CARLO: on-policy Monte Carlo control (see monte_carlo_core.py), the original algorithm
+- VALUE_ITERATION: the grids are small and deterministic (the same action in the same state always
+  leads to the same next state and reward), so Q can be calculated exactly by value iteration
+  with the same rewards and GAMMA. It is deterministic and takes well under a millisecond
+- Q_LEARNING, SARSA: temporal difference control (see td_core.py), Q is learned from every step
+  instead of from complete episodes
+- ATLAS: 4x4 grid of the dynamic policy only. The value iteration policies of every layout are
+  calculated offline (dynamic_policy/build_policy_atlas.py) and looked up, see policy_atlas.py
+The solver of each robot is selected with the solver argument of Robot (default constants.POLICY_SOLVER).
+'''
+
+from collections import namedtuple
+import numpy as np
+import constants
+import gridworld
+import monte_carlo_core
+import td_core
+
+MONTE_CARLO = "monte_carlo"
+VALUE_ITERATION = "value_iteration"
+ATLAS = "atlas"
+Q_LEARNING = "q_learning"
+SARSA = "sarsa"
+SOLVERS = (MONTE_CARLO, VALUE_ITERATION, ATLAS, Q_LEARNING, SARSA) # the index is the solver id used in the policy keys
+
+# parameters of the local grid of a robot and of its solvers (built from the constants of its monte_carlo module),
+# same names as the arguments of solve
+GridParams = namedtuple("GridParams", ["size", "step_cost", "obstacle_cost", "start", "episodes", "max_steps", "gamma", "eps",
+                                       "batch_size", "window", "tolerance", "alpha"])
+
+# Q(s, a) = r(s') + gamma * V(s'), where s' is the state reached from s with a and
+# V is the value of the best action (0 in the terminal states)
+def value_iteration(grid, gamma, theta=1e-12, max_iterations=10000):
+    V = np.zeros(grid.n_states)
+    for i in range(max_iterations):
+        Q = grid.reward[grid.next_state] + gamma * V[grid.next_state]
+        new_V = np.where(grid.terminal, 0, Q.max(axis=1))
+        delta = np.abs(new_V - V).max()
+        V = new_V
+        if delta < theta:
+            break
+    return grid.reward[grid.next_state] + gamma * V[grid.next_state]
+
+# integer key of the policy of a layout: solver id, end state and obstacle bitmask of the grid.
+# The same layout always has the same key, whatever the order or repetitions of obstacle_states
+def policy_key(solver, end_state, obstacle_states, rows, cols):
+    n_states = rows * cols
+    layout = SOLVERS.index(solver) * n_states + end_state[0] * cols + end_state[1]
+    return (layout << n_states) | monte_carlo_core.state_mask(obstacle_states, cols)
+
+# returns the Q table of the grid (gridworld.GridWorld), the number of episodes cut at max_steps,
+# the number of episodes played and the number of steps of all of them (0 and 0 for value iteration). With window, the learners stop when the policy has converged
+# (see monte_carlo_core.has_converged), episodes is then the maximum number of episodes.
+# alpha is the learning rate of Q_LEARNING and SARSA
+def solve(grid, solver, start, episodes, max_steps, gamma, eps, batch_size=1, window=None, tolerance=0.0, alpha=0.5):
+    solver = solver or constants.POLICY_SOLVER
+    if solver == VALUE_ITERATION:
+        return value_iteration(grid, gamma), 0, 0, 0
+    if solver == MONTE_CARLO:
+        if batch_size > 1:
+            Q, N, n_truncated, n_episodes, n_steps = monte_carlo_core.run_batched_episodes(grid, start, episodes, max_steps, gamma, eps, batch_size,
+                                                                                           window=window, tolerance=tolerance)
+        else:
+            Q, N, n_truncated, n_episodes, n_steps = monte_carlo_core.run_episodes(grid, start, episodes, max_steps, gamma, eps,
+                                                                                   window=window, tolerance=tolerance)
+        return Q, n_truncated, n_episodes, n_steps
+    if solver in (Q_LEARNING, SARSA):
+        Q, N, n_truncated, n_episodes, n_steps = td_core.run_td(grid, start, episodes, max_steps, gamma, eps, alpha, solver == SARSA,
+                                                                batch_size, window=window, tolerance=tolerance)
+        return Q, n_truncated, n_episodes, n_steps
+    if solver == ATLAS:
+        raise ValueError("the atlas solver only has the layouts of the 4x4 grid of the dynamic policy, see policy_atlas.py")
+    raise ValueError(f"unknown policy solver {solver}")
+
+# policy of a local grid, dict (row, col) -> action, calculated with the solver and the GridParams of the grid.
+# end_state and obstacle_states are (row, col) states of the grid, name is used in the messages
+def grid_policy(params, end_state, obstacle_states, solver, name):
+    # every step costs step_cost, so the agent learns to minimize the number of moves
+    # and to go past the obstacles only when there is no other way
+    grid = gridworld.layout_grid(params.size, end_state, obstacle_states, params.step_cost, params.obstacle_cost)
+    monte_carlo_core.print_values(grid.rewards(), grid)
+
+    Q, n_truncated, n_episodes, n_steps = solve(grid, solver, params.start, params.episodes, params.max_steps, params.gamma,
+                                                params.eps, params.batch_size, params.window, params.tolerance, params.alpha)
+    if n_truncated > 0:
+        print(f"{name}: {n_truncated} episodes took more than {params.max_steps} steps and were cut.")
+    if 0 < n_episodes < params.episodes:
+        print(f"{name}: the policy converged after {n_episodes} episodes.")
+    if n_episodes > 0:
+        print(f"{name}: {n_steps} steps in {n_episodes} episodes.")
+
+    # calculate policy pi(s) = argmax[a]{ Q(s,a) }
+    return monte_carlo_core.greedy_policy(grid, Q)
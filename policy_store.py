@@ -0,0 +1,130 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Policy cache of the dynamic policies kept in a SQLite file, so the layouts solved in one run
+are not solved again in the next runs. It is used like the master_policy dict:
+policy_key (see policy_solvers.policy_key) -> policy dict (row, col) -> action.
+- the policies are read from the file the first time the store is used (warm start) and kept in memory,
+  in a policy_cache.LRUCache with the max_entries and max_bytes budget. A key that is not in memory
+  is looked up in the file, so the policies evicted from memory and the ones written by other
+  processes are found too
+- the file is in WAL mode, so several processes can read and write it at the same time.
+  Each process has its own connection, opened on first use
+- every row has the version of the parameters of the solver (grid size, GAMMA, EPS, EPISODES...,
+  see POLICY_VERSION in the monte_carlo modules). The rows of other versions are ignored, so
+  changing the parameters invalidates the saved policies
+A policy is saved as a string with the action of each state, row by row, ' ' for the terminal state.
+'''
+
+import os
+import sqlite3
+from collections.abc import MutableMapping
+import policy_cache
+
+TIMEOUT = 30 # seconds a process waits for the lock of another writer
+
+class PolicyStore(MutableMapping):
+    def __init__(self, file_name, version, grid_size, max_entries=None, max_bytes=None):
+        self.file_name = file_name
+        self.version = version
+        self.grid_size = grid_size
+        self.policies = policy_cache.LRUCache(max_entries, max_bytes) # policies read or written by this process
+        self.connection = None
+        self.pid = None
+
+    # connection of this process, a process created with fork must not use the one of its parent
+    def connect(self):
+        if self.connection is None or self.pid != os.getpid():
+            self.connection = sqlite3.connect(self.file_name, timeout=TIMEOUT)
+            self.pid = os.getpid()
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS policies "
+                                    "(version TEXT, key INTEGER, policy TEXT, PRIMARY KEY (version, key))")
+            self.connection.commit()
+            rows = self.connection.execute("SELECT key, policy FROM policies WHERE version = ?", (self.version,))
+            self.policies.clear()
+            for key, policy in rows:
+                self.policies[key] = self.decode(policy)
+        return self.connection
+
+    def encode(self, policy):
+        return ''.join(policy.get((row, col), ' ') for row in range(self.grid_size) for col in range(self.grid_size))
+
+    def decode(self, text):
+        return {(s // self.grid_size, s % self.grid_size): action for s, action in enumerate(text) if action != ' '}
+
+    def __getitem__(self, key):
+        connection = self.connect()
+        if key not in self.policies:
+            row = connection.execute("SELECT policy FROM policies WHERE version = ? AND key = ?", (self.version, key)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            self.policies[key] = self.decode(row[0])
+        return self.policies[key]
+
+    # when two processes solve the same layout, the policy saved first is kept, in the file and in memory
+    def __setitem__(self, key, policy):
+        connection = self.connect()
+        cursor = connection.execute("INSERT OR IGNORE INTO policies VALUES (?, ?, ?)", (self.version, key, self.encode(policy)))
+        connection.commit()
+        if cursor.rowcount == 1:
+            self.policies[key] = policy
+        else: # another process saved it first
+            row = connection.execute("SELECT policy FROM policies WHERE version = ? AND key = ?", (self.version, key)).fetchone()
+            self.policies[key] = self.decode(row[0])
+
+    def __delitem__(self, key):
+        connection = self.connect()
+        if connection.execute("DELETE FROM policies WHERE version = ? AND key = ?", (self.version, key)).rowcount == 0:
+            raise KeyError(key)
+        connection.commit()
+        self.policies.pop(key, None)
+
+    # the policies in memory: the most recently used of the ones in the file and the ones saved since then
+    def __iter__(self):
+        self.connect()
+        return iter(list(self.policies))
+
+    def __len__(self):
+        self.connect()
+        return len(self.policies)
+
+    # removes the policies of this version from memory and from the file
+    def clear(self):
+        connection = self.connect()
+        self.policies.clear()
+        connection.execute("DELETE FROM policies WHERE version = ?", (self.version,))
+        connection.commit()
+
+    # number and memory use of the policies in memory, see policy_cache.LRUCache
+    @property
+    def size(self):
+        return self.policies.size
+
+    @property
+    def bytes_used(self):
+        return self.policies.bytes_used
+
+    @property
+    def evictions(self):
+        return self.policies.evictions
+
+# PolicyStore in file_name, or a policy_cache.LRUCache (policies kept only in memory) when file_name is None.
+# A relative file_name is in directory (the folder of the robot), not in the current directory
+def open_store(file_name, version, grid_size, max_entries=None, max_bytes=None, directory=None):
+    if file_name is None:
+        return policy_cache.LRUCache(max_entries, max_bytes)
+    if directory is not None:
+        file_name = os.path.join(directory, file_name)
+    return PolicyStore(file_name, version, grid_size, max_entries, max_bytes)
@@ -0,0 +1,131 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Population mode: steps many independent robots at once.
+Positions, headings, step counts and done flags of all the robots are kept in NumPy arrays,
+so moving, sensing and the goal/collision checks run batched instead of one robot per Python loop.
+It implements the naive robot (naive/n_robot.py) and the Bayesian robot (bayesian/b_robot.py),
+which do not depend on per-robot policies.
+'''
+
+import numpy as np
+import constants
+import geometry
+import sonar_engine
+
+NAIVE = "naive"
+BAYESIAN = "bayesian"
+
+FAR_AWAY = 1e9 # position used to pad the obstacle lists of the robots with fewer obstacles
+
+class Population:
+    # one robot per start position, each one with its own goal and obstacle list
+    def __init__(self, robot_pos_list, goal_pos_list, obstacle_lists, co=1, n_sensor=constants.N_SENSOR, sonar_model=None):
+        self.n = len(robot_pos_list)
+        self.pos = np.array(robot_pos_list, dtype=float).reshape(-1, 2)
+        self.goal_pos = np.array(goal_pos_list, dtype=float).reshape(-1, 2)
+        self.co = np.full(self.n, float(co))
+        self.spd = 10 # robot speed in pixels/ step
+        self.steps = np.zeros(self.n, dtype=int)
+        self.hit_obstacle = np.zeros(self.n, dtype=bool)
+        self.reached_goal = np.zeros(self.n, dtype=bool)
+        self.timed_out = np.zeros(self.n, dtype=bool)
+
+        n_obstacles = max([len(obstacle_list) for obstacle_list in obstacle_lists] + [0])
+        self.obstacles = np.full((self.n, n_obstacles, 2), FAR_AWAY)
+        for i, obstacle_list in enumerate(obstacle_lists):
+            self.obstacles[i, :len(obstacle_list)] = geometry.as_points(obstacle_list)
+
+        self.n_sensor = n_sensor
+        self.sensor_index = np.array(sonar_engine.sensor_indexes(n_sensor), dtype=float)
+        self.sensor_offsets = self.sensor_index * constants.SENSOR_FOV
+        self.sonar_model = sonar_model or constants.SONAR_MODEL
+        self.view_r = sonar_engine.view_radius(self.sonar_model)
+        self.goal_brg = geometry.brg_in_deg_array(self.pos, self.goal_pos)
+
+    # robots that have hit an obstacle, reached the goal or used all their steps
+    def done(self):
+        return self.hit_obstacle | self.reached_goal | self.timed_out
+
+    # moves all the robots that are not done by one step, using the given algorithm
+    def update(self, method=BAYESIAN):
+        active = ~self.done()
+        self.steps[active] += 1
+
+        #re-calculate direction to goal
+        self.goal_brg = geometry.brg_in_deg_array(self.pos, self.goal_pos)
+        if method == NAIVE:
+            co = self.goal_brg
+        elif method == BAYESIAN:
+            #re-estimate sensor output by weighted sum method
+            outputs, _ = sonar_engine.ping_batch(self.pos, self.goal_brg, self.sensor_offsets, self.obstacles, constants.SENSOR_MAX_R, self.sonar_model)
+            co1, need_turn = self.weighted_sum_method(outputs, self.goal_brg)
+            co = np.where(self.path_is_clear(), self.goal_brg, np.where(need_turn, co1, self.co))
+        else:
+            raise ValueError(f"unknown method {method}")
+        self.co = np.where(active, co, self.co)
+
+        self.move(1, active)
+        self.hit_obstacle |= active & self.has_hit_obstacle()
+        self.reached_goal |= active & self.has_reached_goal()
+        return self.hit_obstacle, self.reached_goal
+
+    # Sonar_Array.weighted_sum_method for all the robots: returns the new headings and if a turn is needed
+    def weighted_sum_method(self, outputs, robot_co):
+        alert = (outputs < constants.SENSOR_ALERT_R).any(axis=1)
+        d = np.trunc(outputs)
+        sum_d = d.sum(axis=1)
+        sum_wt = (self.sensor_index * d).sum(axis=1)
+        sum_d = np.where(sum_d == 0, 1, sum_d)
+        rec_index = np.ceil(constants.TURN_SCALE_FACTOR * sum_wt / sum_d) #index of sonar with best LOS
+        rec_index = np.where(np.abs(rec_index) > self.n_sensor/2, self.n_sensor/2, rec_index)
+        rec_index = np.where(alert, rec_index, 0)
+        need_turn = rec_index != 0
+        return np.where(need_turn, (robot_co + rec_index * constants.SENSOR_FOV) % 360, robot_co), need_turn
+
+    # geometry.path_is_clear for all the robots, considering only the obstacles in view
+    def path_is_clear(self):
+        d_obs, obs_brg = geometry.dist_and_brg_in_deg_array(self.pos[:, np.newaxis, :], self.obstacles)
+        d_goal = geometry.dist_array(self.pos, self.goal_pos)
+        ahead = (d_obs < self.view_r) & (d_goal[:, np.newaxis] > d_obs)
+        rel_brg_radians = np.radians(np.abs(geometry.relative_brg_array(self.goal_brg[:, np.newaxis], obs_brg)))
+        d_lateral = np.abs(d_obs * np.arcsin(np.minimum(rel_brg_radians, 1)))
+        blocked = ahead & ((rel_brg_radians > 1) | (d_lateral < constants.OBSTACLE_RAD + constants.ROBOT_RAD))
+        return ~blocked.any(axis=1)
+
+    def move(self, dT, active):
+        co = np.radians(self.co)
+        self.pos[active, 0] += self.spd * dT * np.sin(co[active])
+        self.pos[active, 1] -= self.spd * dT * np.cos(co[active])
+
+    def has_hit_obstacle(self):
+        d = geometry.dist_array(self.pos[:, np.newaxis, :], self.obstacles)
+        return (d < constants.OBSTACLE_RAD).any(axis=1)
+
+    def has_reached_goal(self):
+        return geometry.dist_array(self.pos, self.goal_pos) < constants.OBSTACLE_RAD
+
+    # runs until every robot is done. Returns the step number and success of each robot,
+    # counted like the play_episode functions of the run_* scripts
+    def run(self, method=BAYESIAN, max_steps=200):
+        while not self.done().all():
+            self.update(method)
+            self.timed_out |= ~(self.hit_obstacle | self.reached_goal) & (self.steps >= max_steps)
+        return self.steps + 1, self.reached_goal.copy()
+
+# creates a population with one robot per episode setup (see episodes.py)
+def from_episodes(episode_list, co=1, sonar_model=None):
+    return Population([episode["robot_pos"] for episode in episode_list],
+                      [episode["goal_pos"] for episode in episode_list],
+                      [episode["full_obstacle_list"] for episode in episode_list], co,
+                      sonar_model=sonar_model)
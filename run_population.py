@@ -0,0 +1,36 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Run the naive and Bayesian robots in population mode, all the episodes at once,
+and show the performance of each algorithm
+'''
+
+import time
+import constants
+import episodes
+import population
+
+episode_list = episodes.EPISODES[:constants.N_EPISODES]
+
+for method in [population.NAIVE, population.BAYESIAN]:
+    start = time.time()
+    steps, success = population.from_episodes(episode_list).run(method)
+    elapsed = time.time() - start
+
+    print(f"Final result - {method}")
+    print("------------")
+    print("Steps: ", steps.tolist())
+    print("Success: ", success.tolist())
+    print(f"Accuracy: {success.mean()*100}%")
+    print(f"{len(episode_list)} episodes in {elapsed:.3f}s ({len(episode_list)/elapsed:.0f} episodes/s)")
+    print("")
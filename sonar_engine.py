@@ -0,0 +1,128 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Batched sonar engine.
+Calculates the output of all the sensors of a Sonar_Array against all the obstacles
+in one (n_sensor x n_obstacles) array pass, instead of one Sonar.can_observe call per pair.
+Two sonar models are available (constants.SONAR_MODEL):
+- LATERAL: the original model. The outputs are the same ones given by Sonar.ping_simulated
+- RAY: each sensor is a ray from the robot along its line of sight, and the output is the exact
+  distance to the first obstacle (circle of radius OBSTACLE_RAD) crossed by the ray
+'''
+
+import numpy as np
+import constants
+import geometry
+
+LATERAL = "lateral"
+RAY = "ray"
+
+# how far from the robot the centre of an obstacle can be and still be seen by the sensors
+# model=None uses constants.SONAR_MODEL
+def view_radius(model=None):
+    model = model or constants.SONAR_MODEL
+    if model == RAY:
+        return constants.SENSOR_MAX_R + constants.OBSTACLE_RAD
+    return constants.SENSOR_MAX_R
+
+# indexes of the sensors in the same order Sonar_Array creates them: 1..n/2, then -1..-n/2
+def sensor_indexes(n_sensor):
+    i_pos = list(range(1, int(n_sensor/2) + 1))
+    i_neg = list(range(int(-n_sensor/2) , 0))
+    i_pos.reverse()
+    i_neg.reverse()
+    return i_pos + i_neg
+
+# returns the output of each sensor and if it has a valid echo
+# offsets are the relative bearings of the sensors, in the same order of the sonar list
+def ping(robot_pos, robot_co, offsets, obstacle_list, max_r, model=None):
+    if len(obstacle_list) == 0:
+        outputs = np.full(len(offsets), float(constants.SENSOR_MAX_R))
+        return outputs, np.zeros(len(offsets), dtype=bool)
+    obstacles = geometry.as_points(obstacle_list)[np.newaxis]
+    outputs, echoes = ping_batch(np.asarray([robot_pos], dtype=float), np.asarray([robot_co], dtype=float), offsets, obstacles, max_r, model)
+    return outputs[0], echoes[0]
+
+# same as ping for n robots at once: robot_pos is (n_robots, 2), robot_co is (n_robots,)
+# and obstacles is (n_robots, n_obstacles, 2). Returns (n_robots, n_sensor) arrays
+def ping_batch(robot_pos, robot_co, offsets, obstacles, max_r, model=None):
+    model = model or constants.SONAR_MODEL
+    offsets = np.asarray(offsets, dtype=float)
+    if model == LATERAL:
+        return _lateral_ping(robot_pos, robot_co, offsets, obstacles, max_r)
+    if model == RAY:
+        return _ray_ping(robot_pos, robot_co, offsets, obstacles, max_r)
+    raise ValueError(f"unknown sonar model {model}")
+
+# vectorized Sonar.ping_simulated
+def _lateral_ping(robot_pos, robot_co, offsets, obstacles, max_r):
+    d, brg = geometry.dist_and_brg_in_deg_array(robot_pos[:, np.newaxis, :], obstacles) # (n_robots, n_obstacles)
+    d = d[:, np.newaxis, :]
+
+    #rel brg of every obstacle from every sensor LOS, as in rel_brg_fm_offset_sensor
+    look_brg = (robot_co[:, np.newaxis] + offsets) % 360 # (n_robots, n_sensor)
+    rel_brg = brg[:, np.newaxis, :] - look_brg[:, :, np.newaxis] # (n_robots, n_sensor, n_obstacles)
+    rel_brg = np.where(rel_brg < -180, rel_brg + 360, rel_brg)
+    rel_brg_radians = np.radians(rel_brg)
+
+    in_fov = (d < max_r) & (rel_brg_radians >= -1) & (rel_brg_radians <= 1)
+    d_test = np.abs(d * np.arcsin(np.clip(rel_brg_radians, -1, 1)))
+    observed = in_fov & (d_test < constants.OBSTACLE_RAD + constants.ROBOT_RAD)
+
+    echoes = observed.any(axis=2)
+    nearest = np.where(observed, d, np.inf).min(axis=2, initial=np.inf)
+    outputs = np.where(echoes, nearest - constants.SAFETY_DISTANCE, float(constants.SENSOR_MAX_R))
+    return outputs, echoes
+
+# exact ray-circle intersection. The output is the distance from the robot to the first point
+# of an obstacle crossed by the sensor line of sight (0 when the robot is inside it)
+def _ray_ping(robot_pos, robot_co, offsets, obstacles, max_r):
+    look_brg = np.radians((robot_co[:, np.newaxis] + offsets) % 360) # (n_robots, n_sensor)
+    #unit vector of each LOS, same convention as create_vector (y grows downwards)
+    u = np.stack((np.sin(look_brg), -np.cos(look_brg)), axis=-1) # (n_robots, n_sensor, 2)
+    f = obstacles - robot_pos[:, np.newaxis, :] # (n_robots, n_obstacles, 2)
+
+    t_closest = np.einsum('nsk,nmk->nsm', u, f) # distance along the ray to the point closest to the centre
+    d2_centre = (f**2).sum(axis=2)[:, np.newaxis, :] - t_closest**2 # squared distance of that point to the centre
+    half_chord = np.sqrt(np.maximum(constants.OBSTACLE_RAD**2 - d2_centre, 0))
+    t_hit = np.maximum(t_closest - half_chord, 0)
+    observed = (d2_centre <= constants.OBSTACLE_RAD**2) & (t_closest + half_chord >= 0) & (t_hit < max_r)
+
+    echoes = observed.any(axis=2)
+    nearest = np.where(observed, t_hit, np.inf).min(axis=2, initial=np.inf)
+    outputs = np.where(echoes, nearest, float(constants.SENSOR_MAX_R))
+    return outputs, echoes
+
+# remembers what the last ping of a Sonar_Array was calculated for, so it is skipped
+# when its result can not have changed: same obstacles in view and, if there are any,
+# same position and heading. With nothing in view every sensor reports SENSOR_MAX_R,
+# whatever the position and heading of the robot
+class PingCache:
+    def __init__(self):
+        self.key = None
+        self.n_pings = 0
+        self.n_skipped = 0
+
+    # True if the sensors have to be pinged again
+    def is_stale(self, robot_pos, robot_co, obstacle_list):
+        in_view = tuple(tuple(obs) for obs in obstacle_list)
+        if len(in_view) == 0:
+            key = in_view
+        else:
+            key = (in_view, tuple(robot_pos), robot_co)
+        if key == self.key:
+            self.n_skipped += 1
+            return False
+        self.key = key
+        self.n_pings += 1
+        return True
@@ -0,0 +1,30 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Builds the master policy tables of the static policy robot (see static_policy_tables.py),
+for 1 and 2 obstacles, and saves them in static_policy_tables.file_name(n_obstacles), in the static_policy folder.
+Same training as master-policy.py with a step limit, without the plots, and all the layouts solved in parallel.
+The tables are a different Monte Carlo sample than the version 0 ones, the robot uses them (see ROBOT_VERSION).
+'''
+
+import time
+import static_policy_tables
+
+PROCESSES = None # None uses all the CPUs
+
+if __name__ == "__main__":
+    for n_obstacles in (1, 2):
+        start = time.time()
+        table = static_policy_tables.build(n_obstacles, PROCESSES)
+        static_policy_tables.save(table, static_policy_tables.file_name(n_obstacles))
+        print(f"{static_policy_tables.path(static_policy_tables.file_name(n_obstacles))}: {table.shape} policies built in {time.time() - start:.1f}s")
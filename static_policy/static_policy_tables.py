@@ -0,0 +1,116 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Master policy tables of the static policy robot: the Monte Carlo policy of the 4x4 grid for every
+position of 1 or 2 obstacles, with the end state in the bottom right corner (3,3), like master-policy.py.
+A table is a uint8 array with the index of the action (in ALL_POSSIBLE_ACTIONS) of every state:
+    table_1obs[obstacle, state]
+    table_2obs[obstacle_1, obstacle_2, state]
+where obstacle and state are the cells of the grid numbered row by row, (i, j) is i * 4 + j, same
+indexes as the master_policy dicts obavd3.py used to have. Like in master-policy.py, the end state has
+an action too, the first one ('U'), as its Q values are never updated. obavd3.py needs an action in every cell.
+An obstacle in the end state is moved to (2,2), like in master-policy.py.
+The training has the settings of master-policy.py (a random initial policy, pi improved in every state
+after each episode), but the episodes are cut after MAX_EPISODE_STEPS steps: when the obstacles block the
+end state, wandering costs less than going through them and the episodes of master-policy.py can take
+millions of steps. Monte Carlo with 1000 episodes is far from exact, in many states the actions have
+almost the same Q, so build() gives a different policy than the version 0 tables: each of them agrees
+with version 0 in about 70% of the states, as much as two builds with different seeds agree with each other.
+The robot does as well with them: over the first 200 stored episodes with seeds 1, 2 and 3, the version 2
+tables reach the goal in 64.5%, 67% and 64.5% of them (22.6, 22.4 and 21.6 mean steps) and the version 0
+tables in 66.5%, 64.5% and 65.5% (22.2, 22.1 and 22.6 mean steps). So the robot uses the tables built here
+(ROBOT_VERSION), which can be rebuilt from this code. The version 0 tables are kept.
+Every layout is an independent Monte Carlo training, so they are solved in a pool of processes,
+each one with its own random seed (SEED + index of the layout), and the tables are the same
+whatever the number of processes.
+At runtime the table files are memory-mapped on first use, so a policy lookup is one array index
+and the processes running the robot share the same pages.
+'''
+
+import multiprocessing
+import numpy as np
+import os
+import sys
+sys.path.insert(0,'..')
+import gridworld
+import monte_carlo_core
+import policy_atlas
+
+VERSION = 2 # change it when the parameters below change, the tables of other versions are in other files
+ROBOT_VERSION = 2 # tables used by the robot (obavd3.py), 0 = the tables trained with master-policy.py
+GRID_SIZE = 4
+END_STATE = (3, 3)
+STEP_COST = -1
+OBSTACLE_COST = -5
+EPISODES = 1000
+MAX_EPISODE_STEPS = 1000
+GAMMA = 0.7
+EPS = 0.1
+SEED = 2020
+NO_ACTION = policy_atlas.NO_ACTION
+N_CELLS = GRID_SIZE * GRID_SIZE
+DIRECTORY = os.path.dirname(os.path.abspath(__file__)) # the table files are in the folder of this module
+
+# file of the table with n_obstacles obstacles, in DIRECTORY (see path)
+def file_name(n_obstacles, version=VERSION):
+    return f"master_policy_{n_obstacles}obs_v{version}.npy"
+
+# actions of every state for the obstacles in the cells of the layout, with the random seed of the layout
+def solve_layout(layout):
+    seed, cells = layout
+    np.random.seed(seed)
+    obstacles = [(2, 2) if divmod(obstacle_cell, GRID_SIZE) == END_STATE else divmod(obstacle_cell, GRID_SIZE) for obstacle_cell in cells]
+    grid = gridworld.layout_grid(GRID_SIZE, END_STATE, obstacles, STEP_COST, OBSTACLE_COST)
+    # the episodes start in any state but (0,0) and the end state, from a random policy
+    starts = grid.all_states()[1:-1]
+    pi_init = np.random.randint(len(monte_carlo_core.ALL_POSSIBLE_ACTIONS), size=grid.n_states)
+    Q, _, _, _, _ = monte_carlo_core.run_episodes(grid, starts, EPISODES, MAX_EPISODE_STEPS, GAMMA, EPS, q_init=0,
+                                                  pi_init=pi_init, improve_all=True)
+    return Q.argmax(axis=1).astype(np.uint8)
+
+# table of all the layouts with n_obstacles obstacles, solved in processes processes (None = number of CPUs)
+def build(n_obstacles, processes=None):
+    cells = np.array(np.unravel_index(np.arange(N_CELLS ** n_obstacles), (N_CELLS,) * n_obstacles)).T
+    layouts = [(SEED + index, tuple(layout_cells.tolist())) for index, layout_cells in enumerate(cells)]
+    with multiprocessing.Pool(processes) as pool:
+        actions = pool.map(solve_layout, layouts)
+    return np.array(actions, dtype=np.uint8).reshape((N_CELLS,) * n_obstacles + (N_CELLS,))
+
+# path of a table file, a relative name is in DIRECTORY whatever the current directory
+def path(name):
+    return os.path.join(DIRECTORY, name)
+
+def save(table, file_name):
+    np.save(path(file_name), table)
+
+_tables = {} # file name -> memory-mapped table
+
+def load(n_obstacles, version=ROBOT_VERSION):
+    name = file_name(n_obstacles, version)
+    if name not in _tables:
+        try:
+            _tables[name] = np.load(path(name), mmap_mode='r')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"master policy table {name} not found, run build_static_policies.py to create it")
+    return _tables[name]
+
+# cell of a (i, j) location in the 4x4 grid
+def cell(location):
+    return location[0] * GRID_SIZE + location[1]
+
+# action of the cell for the obstacles in obstacle_cells (one cell per obstacle of the table), or ' ' if there is none
+def lookup(table, obstacle_cells, state_cell):
+    action = table[tuple(obstacle_cells) + (state_cell,)]
+    if action == NO_ACTION:
+        return ' '
+    return monte_carlo_core.ALL_POSSIBLE_ACTIONS[action]
@@ -0,0 +1,163 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Array-backed temporal difference control for the local grids of the dynamic policies
+(see gridworld.GridWorld): Q-learning and SARSA with epsilon-greedy exploration.
+Unlike Monte Carlo, Q is updated after every step, so no complete episodes are needed:
+    Q(s, a) += alpha * (r + gamma * Q(s', a') - Q(s, a))
+with a' the greedy action of s' (Q-learning) or the action taken in s' (SARSA), and Q(s', a') = 0
+when s' is terminal. batch_size agents walk the grid at the same time with the same Q, and an
+agent starts a new episode from start as soon as its episode ends.
+Like the Monte Carlo runs, it stops after episodes episodes or when the greedy policy has converged
+(see monte_carlo_core.has_converged).
+With one agent (batch_size 1, the default of the robots) the steps are played by run_td_single on lists:
+the same updates, without the overhead of the array operations on a batch of one.
+'''
+
+import numpy as np
+from monte_carlo_core import ALL_POSSIBLE_ACTIONS, has_converged
+
+# epsilon-greedy action of each state in states
+def choose_actions(Q, states, eps):
+    n_actions = Q.shape[1]
+    actions = Q[states].argmax(axis=1)
+    explore = np.random.random(len(states)) < eps
+    actions[explore] = np.random.randint(n_actions, size=int(explore.sum()))
+    return actions
+
+# returns Q, the number of updates of each (state, action), the number of episodes cut at max_steps,
+# the number of episodes played and the number of steps played in them
+def run_td(grid, start, episodes, max_steps, gamma, eps, alpha, sarsa=False, batch_size=1, q_init=0,
+           window=None, tolerance=0.0):
+    if batch_size == 1:
+        return run_td_single(grid, start, episodes, max_steps, gamma, eps, alpha, sarsa, q_init, window, tolerance)
+    n_actions = len(ALL_POSSIBLE_ACTIONS)
+    Q = np.full((grid.n_states, n_actions), float(q_init))
+    Q[grid.terminal] = 0
+    N = np.zeros((grid.n_states, n_actions), dtype=int)
+    start = grid.state_index(start)
+    states = np.full(batch_size, start)
+    actions = choose_actions(Q, states, eps)
+    lengths = np.zeros(batch_size, dtype=int) # steps of the current episode of each agent
+    greedy = Q.argmax(axis=1)
+    n_truncated = 0
+    n_episodes = 0
+    n_steps = 0
+    stable = 0
+    if grid.terminal[start]:
+        return Q, N, 0, 0, 0
+    while n_episodes < episodes and not has_converged(stable, window):
+        next_states = grid.next_state[states, actions]
+        rewards = grid.reward[next_states]
+        terminal = grid.terminal[next_states]
+        next_actions = choose_actions(Q, next_states, eps)
+        if sarsa:
+            next_q = Q[next_states, next_actions]
+        else:
+            next_q = Q[next_states].max(axis=1)
+        errors = rewards + gamma * np.where(terminal, 0, next_q) - Q[states, actions]
+        # the agents in the same (state, action) update it once, with the mean of their errors
+        pairs = states * n_actions + actions
+        counts = np.bincount(pairs, minlength=Q.size)
+        updated = counts > 0
+        delta = alpha * np.bincount(pairs, weights=errors, minlength=Q.size)[updated] / counts[updated]
+        Q.flat[updated] += delta
+        N.flat[updated] += counts[updated]
+        n_steps += batch_size
+        lengths += 1
+
+        # Like the Monte Carlo episodes, the episodes are cut after max_steps + 1 steps
+        truncated = ~terminal & (lengths > max_steps)
+        ended = terminal | truncated
+        n_ended = int(ended.sum())
+        n_truncated += int(truncated.sum())
+        n_episodes += n_ended
+
+        new_greedy = Q.argmax(axis=1)
+        if np.abs(delta).max() >= tolerance or (new_greedy != greedy)[~grid.terminal].any():
+            stable = 0
+        else:
+            stable += n_ended
+        greedy = new_greedy
+
+        states = np.where(ended, start, next_states)
+        actions = next_actions
+        if n_ended:
+            lengths[ended] = 0
+            actions[ended] = choose_actions(Q, states[ended], eps)
+    return Q, N, n_truncated, n_episodes, n_steps
+
+# run_td with one agent, one step at a time on lists. Same updates, episode cuts and convergence test
+def run_td_single(grid, start, episodes, max_steps, gamma, eps, alpha, sarsa=False, q_init=0,
+                  window=None, tolerance=0.0):
+    n_actions = len(ALL_POSSIBLE_ACTIONS)
+    Q = np.full((grid.n_states, n_actions), float(q_init))
+    Q[grid.terminal] = 0
+    start = grid.state_index(start)
+    if grid.terminal[start]:
+        return Q, np.zeros((grid.n_states, n_actions), dtype=int), 0, 0, 0
+    q = Q.tolist()
+    N = [[0] * n_actions for s in range(grid.n_states)]
+    next_state = grid.next_state.tolist()
+    reward = grid.reward.tolist()
+    terminal = grid.terminal.tolist()
+
+    # epsilon-greedy action of state s, the first of the best actions when they are equal (like argmax)
+    def choose_action(s):
+        if np.random.random() < eps:
+            return np.random.randint(n_actions)
+        row = q[s]
+        return row.index(max(row))
+
+    n_truncated = 0
+    n_episodes = 0
+    n_steps = 0
+    stable = 0
+    s = start
+    a = choose_action(s)
+    length = 0 # steps of the current episode
+    while n_episodes < episodes and not has_converged(stable, window):
+        next_s = next_state[s][a]
+        next_a = choose_action(next_s)
+        if terminal[next_s]:
+            next_q = 0
+        elif sarsa:
+            next_q = q[next_s][next_a]
+        else:
+            next_q = max(q[next_s])
+        row = q[s]
+        greedy = row.index(max(row))
+        delta = alpha * (reward[next_s] + gamma * next_q - row[a])
+        row[a] += delta
+        N[s][a] += 1
+        n_steps += 1
+        length += 1
+
+        # Like the Monte Carlo episodes, the episodes are cut after max_steps + 1 steps
+        truncated = not terminal[next_s] and length > max_steps
+        ended = terminal[next_s] or truncated
+        n_truncated += truncated
+        n_episodes += ended
+        if abs(delta) >= tolerance or row.index(max(row)) != greedy:
+            stable = 0
+        elif ended:
+            stable += 1
+
+        if ended:
+            s = start
+            a = choose_action(s)
+            length = 0
+        else:
+            s = next_s
+            a = next_a
+    return np.array(q), np.array(N), n_truncated, n_episodes, n_steps
@@ -0,0 +1,66 @@
+#
+# School of Continuing Studies, University of Toronto
+# 3547 TERM PROJECT
+# Intelligent Systems and Reinforcement Learning
+# Robot obstacle avoidance with reinforcement learning
+#
+# Alexandre Dietrich
+# Ankur Tyagi
+# Haitham Alamri
+# Rodolfo Vasconcelos
+#
+
+'''
+Trajectory of a robot: the positions it went through, kept in a preallocated (n, 2) float array.
+The array grows by doubling when it is full or, if max_len is given, works as a ring buffer
+that keeps only the last max_len positions.
+view() returns the positions in order without copying them, for drawing, analysis and export.
+'''
+
+import numpy as np
+
+class Trajectory:
+    def __init__(self, max_len=None, capacity=256):
+        self.max_len = max_len
+        self.count = 0 # number of positions appended since the last clear
+        if max_len is None:
+            self.buffer = np.empty((capacity, 2))
+        else:
+            #every position is written twice, at i and i + max_len, so the last max_len
+            #positions are always in one contiguous slice of the buffer
+            self.buffer = np.empty((2 * max_len, 2))
+
+    def append(self, pos):
+        if self.max_len is None:
+            if self.count == len(self.buffer):
+                new_buffer = np.empty((2 * len(self.buffer), 2))
+                new_buffer[:self.count] = self.buffer
+                self.buffer = new_buffer
+            self.buffer[self.count] = pos[0], pos[1]
+        else:
+            i = self.count % self.max_len
+            self.buffer[i] = pos[0], pos[1]
+            self.buffer[i + self.max_len] = pos[0], pos[1]
+        self.count += 1
+
+    # (n, 2) array with the positions, oldest first. It is a view of the buffer,
+    # so it is only valid until the next append or clear
+    def view(self):
+        if self.max_len is None or self.count <= self.max_len:
+            return self.buffer[:self.count]
+        start = self.count % self.max_len
+        return self.buffer[start:start + self.max_len]
+
+    def clear(self):
+        self.count = 0
+
+    def save(self, file_name):
+        np.save(file_name, self.view())
+
+    def __len__(self):
+        if self.max_len is None:
+            return self.count
+        return min(self.count, self.max_len)
+
+    def __iter__(self):
+        return iter(self.view())